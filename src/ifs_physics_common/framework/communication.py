@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2022-2024 ETH Zurich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+from abc import ABC, abstractmethod
+import multiprocessing
+import queue
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from multiprocessing.queues import Queue
+    from typing import Any, List, Optional
+
+
+class Communicator(ABC):
+    """Minimal point-to-point and collective communication between ranks."""
+
+    rank: int
+    size: int
+
+    @abstractmethod
+    def send(self, obj: Any, dest: int) -> None:
+        ...
+
+    @abstractmethod
+    def recv(self, source: int) -> Any:
+        ...
+
+    def gather(self, obj: Any, root: int = 0) -> Optional[List[Any]]:
+        """Collect ``obj`` from all ranks on ``root``, in rank order."""
+        if self.rank != root:
+            self.send(obj, root)
+            return None
+        return [obj if rank == root else self.recv(rank) for rank in range(self.size)]
+
+    def bcast(self, obj: Any, root: int = 0) -> Any:
+        """Broadcast ``obj`` from ``root`` to all ranks."""
+        if self.rank != root:
+            return self.recv(root)
+        for rank in range(self.size):
+            if rank != root:
+                self.send(obj, rank)
+        return obj
+
+    def allreduce(self, obj: Any, op: Callable[[Any, Any], Any]) -> Any:
+        """Reduce ``obj`` over all ranks with the binary operation ``op``, on all ranks."""
+        values = self.gather(obj, root=0)
+        out = None
+        if values is not None:
+            out = values[0]
+            for value in values[1:]:
+                out = op(out, value)
+        return self.bcast(out, root=0)
+
+    def barrier(self) -> None:
+        self.allreduce(None, lambda a, b: None)
+
+
+class SerialCommunicator(Communicator):
+    """Communicator of a single rank."""
+
+    rank = 0
+    size = 1
+
+    def send(self, obj: Any, dest: int) -> None:
+        raise RuntimeError("Cannot send messages with a serial communicator.")
+
+    def recv(self, source: int) -> Any:
+        raise RuntimeError("Cannot receive messages with a serial communicator.")
+
+
+class LocalCommunicator(Communicator):
+    """
+    Communicator between processes on the same node, relying on ``multiprocessing`` queues.
+
+    ``queues[i][j]`` carries the messages from rank ``i`` to rank ``j``. Use ``run_local`` to
+    launch a function over multiple ranks.
+    """
+
+    def __init__(self, rank: int, queues: Sequence[Sequence[Queue]]) -> None:
+        self.rank = rank
+        self.size = len(queues)
+        self.queues = queues
+
+    def send(self, obj: Any, dest: int) -> None:
+        self.queues[self.rank][dest].put(obj)
+
+    def recv(self, source: int) -> Any:
+        return self.queues[source][self.rank].get()
+
+
+class MPICommunicator(Communicator):
+    """Communicator wrapping an MPI communicator from ``mpi4py``, by default ``COMM_WORLD``."""
+
+    def __init__(self, comm: Optional[Any] = None) -> None:
+        from mpi4py import MPI
+
+        self.comm = comm or MPI.COMM_WORLD
+        self.rank = self.comm.Get_rank()
+        self.size = self.comm.Get_size()
+
+    def send(self, obj: Any, dest: int) -> None:
+        self.comm.send(obj, dest=dest)
+
+    def recv(self, source: int) -> Any:
+        return self.comm.recv(source=source)
+
+    def gather(self, obj: Any, root: int = 0) -> Optional[List[Any]]:
+        return self.comm.gather(obj, root=root)  # type: ignore[no-any-return]
+
+    def bcast(self, obj: Any, root: int = 0) -> Any:
+        return self.comm.bcast(obj, root=root)
+
+    def barrier(self) -> None:
+        self.comm.Barrier()
+
+
+def _run_rank(
+    target: Callable[..., Any],
+    rank: int,
+    queues: Sequence[Sequence[Queue]],
+    results: Queue,
+    args: Sequence[Any],
+) -> None:
+    try:
+        results.put((rank, target(LocalCommunicator(rank, queues), *args), None))
+    except BaseException as e:
+        results.put((rank, None, e))
+
+
+def run_local(target: Callable[..., Any], num_ranks: int, *args: Any) -> List[Any]:
+    """
+    Run ``target(comm, *args)`` over ``num_ranks`` processes connected by a
+    ``LocalCommunicator`` ``comm``, and return the result of each rank.
+
+    As soon as a rank fails or dies, the other ranks are terminated, since they may be blocked
+    waiting for messages from the failed rank.
+    """
+    context = multiprocessing.get_context()
+    queues = [[context.Queue() for _ in range(num_ranks)] for _ in range(num_ranks)]
+    results = context.Queue()
+    processes = [
+        context.Process(target=_run_rank, args=(target, rank, queues, results, args))
+        for rank in range(num_ranks)
+    ]
+    for process in processes:
+        process.start()
+
+    out: List[Any] = [None] * num_ranks
+    done = set()
+    error: Optional[BaseException] = None
+    failed_rank = None
+    try:
+        while len(done) < num_ranks and error is None:
+            try:
+                rank, result, rank_error = results.get(timeout=1.0)
+            except queue.Empty:
+                for rank, process in enumerate(processes):
+                    if rank not in done and not process.is_alive() and results.empty():
+                        failed_rank = rank
+                        error = RuntimeError(f"Exit code {process.exitcode}.")
+                        break
+                continue
+            done.add(rank)
+            out[rank] = result
+            if rank_error is not None:
+                failed_rank, error = rank, rank_error
+    finally:
+        if error is not None:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+        for process in processes:
+            process.join()
+
+    if error is not None:
+        raise RuntimeError(f"Rank {failed_rank} failed.") from error
+    return out
@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 from abc import abstractmethod
+from contextlib import contextmanager
 from functools import cached_property
 from typing import Optional, TYPE_CHECKING
 
@@ -25,18 +26,22 @@ from sympl._core.core_components import (
 )
 
 from ifs_physics_common.framework.config import GT4PyConfig
-from ifs_physics_common.framework.stencil import compile_stencil
+from ifs_physics_common.framework.stencil import compile_stencil, submit_stencil
 from ifs_physics_common.framework.storage import (
     get_data_shape_from_name,
     get_dtype_from_name,
     zeros,
 )
+from ifs_physics_common.utils.timing import profile
 
 if TYPE_CHECKING:
-    from typing import Any, Dict
+    from collections.abc import Iterator, Sequence
+    from concurrent.futures import Future
+    from datetime import timedelta
+    from typing import Any, ClassVar, Dict, Tuple
 
     from gt4py.cartesian import StencilObject
-    from sympl._core.typingx import PropertyDict
+    from sympl._core.typingx import DataArrayDict, PropertyDict
 
     from ifs_physics_common.framework.grid import ComputationalGrid
     from ifs_physics_common.utils.typingx import NDArrayLike
@@ -45,6 +50,10 @@ if TYPE_CHECKING:
 class ComputationalGridComponent:
     """Model component defined over a computational grid."""
 
+    _enable_checks: bool
+    _validated_fingerprint: Optional[Tuple[Any, ...]]
+    validate_once: bool
+
     def __init__(self, computational_grid: ComputationalGrid, *, gt4py_config: GT4PyConfig) -> None:
         self.computational_grid = computational_grid
         self.gt4py_config = gt4py_config
@@ -54,6 +63,81 @@ class ComputationalGridComponent:
     ) -> StencilObject:
         return compile_stencil(name, self.gt4py_config, externals)
 
+    def submit_stencil(self, name: str, externals: Optional[Dict[str, Any]] = None) -> Future:
+        return submit_stencil(name, self.gt4py_config, externals)
+
+    def get_state_fingerprint(
+        self, state: DataArrayDict, outputs: Sequence[Optional[DataArrayDict]] = ()
+    ) -> Tuple[Any, ...]:
+        """
+        Fingerprint of the input fields of ``state`` and of the fields of the output dictionaries
+        ``outputs``: for each field, the field itself, its buffer and its units. Holding the
+        objects (rather than their ``id``) prevents the identifiers from being recycled while the
+        fingerprint is alive.
+        """
+        out = []
+        for name in self.input_properties:  # type: ignore[attr-defined]
+            field = state.get(name)
+            if field is not None:
+                out.append((-1, name, field, field.data, field.attrs.get("units")))
+        for index, fields in enumerate(outputs):
+            if fields is None:
+                out.append((index, None, None, None, None))
+                continue
+            for name, field in fields.items():
+                out.append((index, name, field, field.data, field.attrs.get("units")))
+        return tuple(out)
+
+    def is_validated_state(
+        self, state: DataArrayDict, outputs: Sequence[Optional[DataArrayDict]] = ()
+    ) -> bool:
+        """
+        Whether ``state`` and ``outputs`` have the same fingerprint as in the last validated call.
+        """
+        fingerprint = self._validated_fingerprint
+        if fingerprint is None:
+            return False
+        current = self.get_state_fingerprint(state, outputs)
+        return len(current) == len(fingerprint) and all(
+            index == ref_index
+            and name == ref_name
+            and field is ref_field
+            and data is ref_data
+            and units == ref_units
+            for (index, name, field, data, units), (
+                ref_index,
+                ref_name,
+                ref_field,
+                ref_data,
+                ref_units,
+            ) in zip(current, fingerprint)
+        )
+
+    @contextmanager
+    def validate_once_context(
+        self, state: DataArrayDict, *outputs: Optional[DataArrayDict]
+    ) -> Iterator[None]:
+        """
+        Disable Sympl's checks within the context if ``validate_once`` is ``True`` and both
+        ``state`` and the output dictionaries ``outputs`` match the last call which passed the
+        checks.
+        """
+        enable_checks = self._enable_checks
+        if not (enable_checks and self.validate_once):
+            yield
+            return
+
+        if self.is_validated_state(state, outputs):
+            self._enable_checks = False
+            try:
+                yield
+            finally:
+                self._enable_checks = enable_checks
+        else:
+            self._validated_fingerprint = None
+            yield
+            self._validated_fingerprint = self.get_state_fingerprint(state, outputs)
+
     def fill_properties_with_dims(self, properties: PropertyDict) -> PropertyDict:
         for field_name, field_prop in properties.items():
             field_prop["dims"] = self.computational_grid.grids[field_prop["grid"]].dims
@@ -72,7 +156,15 @@ class ComputationalGridComponent:
 
 
 class DiagnosticComponent(ComputationalGridComponent, SymplDiagnosticComponent):
-    """Grid-aware variant of Sympl's ``DiagnosticComponent``."""
+    """
+    Grid-aware variant of Sympl's ``DiagnosticComponent``.
+
+    If ``persistent_outputs`` is ``True``, the diagnostics are allocated on the first call and
+    overwritten by all subsequent calls which do not provide ``out``.
+
+    If ``validate_once`` is ``True``, Sympl's checks run only when the input or output fields,
+    their buffers or their units differ from those of the last validated call.
+    """
 
     def __init__(
         self,
@@ -80,9 +172,28 @@ class DiagnosticComponent(ComputationalGridComponent, SymplDiagnosticComponent):
         *,
         enable_checks: bool = True,
         gt4py_config: GT4PyConfig,
+        persistent_outputs: bool = False,
+        validate_once: bool = False,
     ) -> None:
         super().__init__(computational_grid, gt4py_config=gt4py_config)
         super(ComputationalGridComponent, self).__init__(enable_checks=enable_checks)
+        self.persistent_outputs = persistent_outputs
+        self.validate_once = validate_once
+        self._validated_fingerprint: Optional[Tuple[Any, ...]] = None
+        self._persistent_diagnostics: Optional[DataArrayDict] = None
+
+    def __call__(
+        self, state: DataArrayDict, out: Optional[DataArrayDict] = None
+    ) -> DataArrayDict:
+        reuse_diagnostics = self.persistent_outputs and out is None
+        if reuse_diagnostics:
+            out = self._persistent_diagnostics
+        with profile(type(self).__name__, exec_info=self.gt4py_config.exec_info):
+            with self.validate_once_context(state, out):
+                diagnostics = super().__call__(state, out=out)
+        if reuse_diagnostics:
+            self._persistent_diagnostics = diagnostics
+        return diagnostics  # type: ignore[no-any-return]
 
     @cached_property
     def input_properties(self) -> PropertyDict:
@@ -117,7 +228,26 @@ class DiagnosticComponent(ComputationalGridComponent, SymplDiagnosticComponent):
 
 
 class ImplicitTendencyComponent(ComputationalGridComponent, SymplImplicitTendencyComponent):
-    """Grid-aware variant of Sympl's ``ImplicitTendencyComponent``."""
+    """
+    Grid-aware variant of Sympl's ``ImplicitTendencyComponent``.
+
+    If ``persistent_outputs`` is ``True``, the tendencies and the diagnostics are allocated on the
+    first call and overwritten by all subsequent calls which do not provide ``out_tendencies``
+    and ``out_diagnostics``, respectively.
+
+    If ``validate_once`` is ``True``, Sympl's checks run only when the input or output fields,
+    their buffers or their units differ from those of the last validated call.
+
+    Passing ``accumulate_into`` to the call adds the tendencies to the given fields, rather than
+    writing them into new or overwritten fields; ``overwrite_tendencies`` may then mark the fields
+    to be overwritten instead. Subclasses whose ``array_call`` honours ``overwrite_tendencies``,
+    i.e. adds to ``out_tendencies[name]`` whenever ``overwrite_tendencies[name]`` is ``False``,
+    should set ``supports_accumulation`` to ``True``, so that they write straight into the
+    given fields. Otherwise, the tendencies are computed into buffers owned by the component,
+    and then added in place to the given fields.
+    """
+
+    supports_accumulation: ClassVar[bool] = False
 
     def __init__(
         self,
@@ -125,9 +255,75 @@ class ImplicitTendencyComponent(ComputationalGridComponent, SymplImplicitTendenc
         *,
         enable_checks: bool = True,
         gt4py_config: GT4PyConfig,
+        persistent_outputs: bool = False,
+        validate_once: bool = False,
     ) -> None:
         super().__init__(computational_grid, gt4py_config=gt4py_config)
         super(ComputationalGridComponent, self).__init__(enable_checks=enable_checks)
+        self.persistent_outputs = persistent_outputs
+        self.validate_once = validate_once
+        self._validated_fingerprint: Optional[Tuple[Any, ...]] = None
+        self._persistent_tendencies: Optional[DataArrayDict] = None
+        self._persistent_diagnostics: Optional[DataArrayDict] = None
+        self._accumulation_tendencies: Optional[DataArrayDict] = None
+
+    def __call__(
+        self,
+        state: DataArrayDict,
+        timestep: timedelta,
+        out_tendencies: Optional[DataArrayDict] = None,
+        out_diagnostics: Optional[DataArrayDict] = None,
+        overwrite_tendencies: Optional[Dict[str, bool]] = None,
+        *,
+        accumulate_into: Optional[DataArrayDict] = None,
+    ) -> Tuple[DataArrayDict, DataArrayDict]:
+        targets: Optional[DataArrayDict] = None
+        overwrite: Dict[str, bool] = {}
+        if accumulate_into is not None:
+            if out_tendencies is not None:
+                raise ValueError("`accumulate_into` cannot be combined with `out_tendencies`.")
+            missing = [name for name in self.tendency_properties if name not in accumulate_into]
+            if len(missing) > 0:
+                raise ValueError(f"Missing tendencies in `accumulate_into`: {', '.join(missing)}.")
+            targets = {name: accumulate_into[name] for name in self.tendency_properties}
+            overwrite = {
+                name: (overwrite_tendencies or {}).get(name, False)
+                for name in self.tendency_properties
+            }
+            if self.supports_accumulation:
+                out_tendencies, overwrite_tendencies = targets, overwrite
+            else:
+                out_tendencies, overwrite_tendencies = self._accumulation_tendencies, None
+
+        reuse_tendencies = self.persistent_outputs and out_tendencies is None and targets is None
+        reuse_diagnostics = self.persistent_outputs and out_diagnostics is None
+        if reuse_tendencies:
+            out_tendencies = self._persistent_tendencies
+        if reuse_diagnostics:
+            out_diagnostics = self._persistent_diagnostics
+        with profile(type(self).__name__, exec_info=self.gt4py_config.exec_info):
+            with self.validate_once_context(state, out_tendencies, out_diagnostics):
+                tendencies, diagnostics = super().__call__(
+                    state,
+                    timestep,
+                    out_tendencies=out_tendencies,
+                    out_diagnostics=out_diagnostics,
+                    overwrite_tendencies=overwrite_tendencies,
+                )
+            if targets is not None and not self.supports_accumulation:
+                self._accumulation_tendencies = tendencies
+                for name, target in targets.items():
+                    if overwrite[name]:
+                        target.data[...] = tendencies[name].data
+                    else:
+                        target.data[...] += tendencies[name].data
+        if targets is not None:
+            tendencies = targets
+        if reuse_tendencies:
+            self._persistent_tendencies = tendencies
+        if reuse_diagnostics:
+            self._persistent_diagnostics = diagnostics
+        return tendencies, diagnostics
 
     @cached_property
     def input_properties(self) -> PropertyDict:
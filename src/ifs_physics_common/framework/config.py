@@ -15,6 +15,7 @@
 # limitations under the License.
 
 from __future__ import annotations
+import json
 import os
 import numpy as np
 from pydantic import BaseModel, validator
@@ -45,11 +46,21 @@ class GT4PyConfig(BaseModel):
     backend: str
     backend_opts: Dict[str, Any] = {}
     build_info: Optional[Dict[str, Any]] = None
+    compilation_executor: Literal["thread", "process"] = "thread"
+    compilation_max_workers: Optional[int] = None
     device_sync: bool = True
     dtypes: DataTypes = DataTypes(bool=bool, float=float, int=int)
     exec_info: Dict[str, Any] = {}
+    first_touch: bool = False
+    lazy_compilation: Union[bool, Literal["background"]] = False
     managed: Union[bool, str] = "gt4py"
+    nproma: Optional[int] = None
+    num_threads: int = 1
+    poison_empty_storages: bool = False
     rebuild: bool = False
+    scratch_dir: Optional[str] = None
+    stencil_cache_dir: Optional[str] = None
+    stencil_cache_max_size: Optional[int] = None
     validate_args: bool = False
     verbose: bool = True
 
@@ -59,6 +70,15 @@ class GT4PyConfig(BaseModel):
         v = v or {}
         return {**v, "__aggregate_data": True}
 
+    def get_fingerprint(self) -> str:
+        """Serialize the options which affect the code generated by GT4Py."""
+        dtypes = {key: np.dtype(value).name for key, value in self.dtypes.dict().items()}
+        return json.dumps(
+            {"backend": self.backend, "backend_opts": self.backend_opts, "dtypes": dtypes},
+            sort_keys=True,
+            default=repr,
+        )
+
     def reset_exec_info(self) -> None:
         self.exec_info = {"__aggregate_data": self.exec_info.get("__aggregate_data", True)}
 
@@ -73,6 +93,31 @@ class GT4PyConfig(BaseModel):
         args["dtypes"] = dtypes
         return GT4PyConfig(**args)
 
+    def with_lazy_compilation(self, flag: Union[bool, Literal["background"]]) -> GT4PyConfig:
+        args = self.dict()
+        args["lazy_compilation"] = flag
+        return GT4PyConfig(**args)
+
+    def with_nproma(self, nproma: Optional[int]) -> GT4PyConfig:
+        args = self.dict()
+        args["nproma"] = nproma
+        return GT4PyConfig(**args)
+
+    def with_num_threads(self, num_threads: int) -> GT4PyConfig:
+        args = self.dict()
+        args["num_threads"] = num_threads
+        return GT4PyConfig(**args)
+
+    def with_rebuild(self, flag: bool) -> GT4PyConfig:
+        args = self.dict()
+        args["rebuild"] = flag
+        return GT4PyConfig(**args)
+
+    def with_scratch_dir(self, scratch_dir: Optional[str]) -> GT4PyConfig:
+        args = self.dict()
+        args["scratch_dir"] = scratch_dir
+        return GT4PyConfig(**args)
+
     def with_validate_args(self, flag: bool) -> GT4PyConfig:
         args = self.dict()
         args["validate_args"] = flag
@@ -95,6 +140,7 @@ class PythonConfig(BaseModel):
     # run
     num_runs: int
     num_threads: int = -1
+    nproma: Optional[int] = None
 
     # low-level and/or backend-related
     precision: Literal["double", "single"]
@@ -115,6 +161,16 @@ class PythonConfig(BaseModel):
     def add_dtypes(cls, v: GT4PyConfig, values: Dict[str, Any]) -> GT4PyConfig:
         return v.with_dtypes(values["data_types"])
 
+    @validator("gt4py_config")
+    @classmethod
+    def add_num_threads(cls, v: GT4PyConfig, values: Dict[str, Any]) -> GT4PyConfig:
+        return v.with_num_threads(values["num_threads"])
+
+    @validator("gt4py_config")
+    @classmethod
+    def add_nproma(cls, v: GT4PyConfig, values: Dict[str, Any]) -> GT4PyConfig:
+        return v.with_nproma(values["nproma"])
+
     def with_backend(self, backend: Optional[str]) -> PythonConfig:
         args = self.dict()
         args["gt4py_config"] = GT4PyConfig(**args["gt4py_config"]).with_backend(backend).dict()
@@ -134,6 +190,11 @@ class PythonConfig(BaseModel):
             args["num_cols"] = num_cols
         return PythonConfig(**args)
 
+    def with_nproma(self, nproma: Optional[int]) -> PythonConfig:
+        args = self.dict()
+        args["nproma"] = nproma
+        return PythonConfig(**args)
+
     def with_num_runs(self, num_runs: Optional[int]) -> PythonConfig:
         args = self.dict()
         if num_runs is not None:
@@ -0,0 +1,462 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2022-2024 ETH Zurich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import os
+import threading
+from typing import TYPE_CHECKING, Union
+
+from ifs_physics_common.framework.components import DiagnosticComponent, ImplicitTendencyComponent
+from ifs_physics_common.framework.grid import ComputationalGrid, I, J, K
+from ifs_physics_common.framework.storage import (
+    attach_shared_data_array,
+    get_data_array,
+    get_data_shape_from_name,
+    get_dtype_from_name,
+    get_shared_storage_info,
+    shared_memory_zeros,
+    zeros,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import timedelta
+    from collections.abc import Hashable
+    from typing import Any, Dict, List, Optional, Tuple
+
+    import numpy as np
+    from sympl._core.typingx import DataArrayDict, PropertyDict
+
+    from ifs_physics_common.framework.config import GT4PyConfig
+    from ifs_physics_common.framework.storage import SharedStorageInfo
+
+    SharedFieldInfo = Tuple[SharedStorageInfo, Hashable, str, Tuple[str, ...], bool]
+
+
+Component = Union[DiagnosticComponent, ImplicitTendencyComponent]
+
+
+def get_column_blocks(num_cols: int, block_size: int) -> List[Tuple[int, int]]:
+    """Split ``num_cols`` columns into contiguous blocks of at most ``block_size`` columns."""
+    return [(start, min(start + block_size, num_cols)) for start in range(0, num_cols, block_size)]
+
+
+class ColumnChunkedComponent:
+    """
+    Run a component over blocks of columns of ``computational_grid``, in the spirit of the NPROMA
+    blocking of the IFS.
+
+    ``component_factory`` takes a computational grid spanning one block of columns, and returns
+    the component to run over that block. All fields are split along the first horizontal
+    dimension into views, so that no data is copied, and each block is processed by a component
+    instance defined over a grid of the size of the block. Fields not defined over the first
+    horizontal dimension are passed as they are. ``block_size`` defaults to
+    ``gt4py_config.nproma``, if set, and to the whole first horizontal dimension otherwise.
+
+    If ``num_threads`` is larger than one, blocks are dispatched to a pool of ``num_threads``
+    threads. Each thread owns its component instances, and draws temporary storages from its own
+    free lists of the storage pool. Since GT4Py stencils release the GIL, this scales with the
+    number of threads on backends which are not multi-threaded themselves. As in
+    ``ComponentPipeline``, ``num_threads`` defaults to ``gt4py_config.num_threads`` divided by
+    ``OMP_NUM_THREADS``, so that OpenMP backends are not oversubscribed.
+    """
+
+    def __init__(
+        self,
+        component_factory: Callable[[ComputationalGrid], Component],
+        computational_grid: ComputationalGrid,
+        *,
+        block_size: Optional[int] = None,
+        gt4py_config: GT4PyConfig,
+        num_threads: Optional[int] = None,
+    ) -> None:
+        self.component_factory = component_factory
+        self.computational_grid = computational_grid
+        self.gt4py_config = gt4py_config
+        if num_threads is None:
+            num_omp_threads = int(os.environ.get("OMP_NUM_THREADS", 1))
+            num_threads = max(1, gt4py_config.num_threads // max(1, num_omp_threads))
+        self.num_threads = num_threads
+
+        nx, self._ny, self._nz = computational_grid.grids[I, J, K].shape
+        self.block_size = min(block_size or gt4py_config.nproma or nx, nx)
+        self.blocks = get_column_blocks(nx, self.block_size)
+        self._local = threading.local()
+        self._grids: Dict[int, ComputationalGrid] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self.component = self.get_component(self.block_size)
+
+    def get_component(self, num_cols: int) -> Component:
+        """Get the component instance of the calling thread processing ``num_cols`` columns."""
+        components = getattr(self._local, "components", None)
+        if components is None:
+            components = self._local.components = {}
+        if num_cols not in components:
+            components[num_cols] = self.component_factory(self.get_grid(num_cols))
+        return components[num_cols]  # type: ignore[no-any-return]
+
+    def get_grid(self, num_cols: int) -> ComputationalGrid:
+        """Get the computational grid spanning ``num_cols`` columns."""
+        with self._lock:
+            if num_cols not in self._grids:
+                self._grids[num_cols] = ComputationalGrid(num_cols, self._ny, self._nz)
+            return self._grids[num_cols]
+
+    def shutdown(self) -> None:
+        """Shut down the pool of threads, if any."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    @property
+    def input_properties(self) -> PropertyDict:
+        return self.component.input_properties
+
+    @property
+    def tendency_properties(self) -> PropertyDict:
+        return getattr(self.component, "tendency_properties", {})
+
+    @property
+    def diagnostic_properties(self) -> PropertyDict:
+        return self.component.diagnostic_properties
+
+    def __call__(
+        self,
+        state: DataArrayDict,
+        timestep: Optional[timedelta] = None,
+        *,
+        out_tendencies: Optional[DataArrayDict] = None,
+        out_diagnostics: Optional[DataArrayDict] = None,
+    ) -> Union[DataArrayDict, Tuple[DataArrayDict, DataArrayDict]]:
+        """
+        Process ``state`` block by block. Return the diagnostics if the component is a
+        ``DiagnosticComponent``, and the tendencies and the diagnostics otherwise.
+        """
+        is_tendency_component = isinstance(self.component, ImplicitTendencyComponent)
+        tendencies = out_tendencies or (
+            self.allocate_outputs(self.tendency_properties) if is_tendency_component else {}
+        )
+        diagnostics = out_diagnostics or self.allocate_outputs(self.diagnostic_properties)
+
+        if self.num_threads > 1 and len(self.blocks) > 1:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.num_threads, thread_name_prefix="column_block"
+                )
+            futures = [
+                self._executor.submit(
+                    self.run_block, state, timestep, tendencies, diagnostics, start, stop
+                )
+                for start, stop in self.blocks
+            ]
+            for future in futures:
+                future.result()
+        else:
+            for start, stop in self.blocks:
+                self.run_block(state, timestep, tendencies, diagnostics, start, stop)
+
+        if is_tendency_component:
+            return tendencies, diagnostics
+        else:
+            return diagnostics
+
+    def run_block(
+        self,
+        state: DataArrayDict,
+        timestep: Optional[timedelta],
+        tendencies: DataArrayDict,
+        diagnostics: DataArrayDict,
+        start: int,
+        stop: int,
+    ) -> None:
+        """Process the columns ``start`` to ``stop`` (excluded)."""
+        component = self.get_component(stop - start)
+        block_state = self.get_block(state, self.input_properties, start, stop)
+        block_diagnostics = self.get_block(diagnostics, self.diagnostic_properties, start, stop)
+        if isinstance(component, ImplicitTendencyComponent):
+            block_tendencies = self.get_block(tendencies, self.tendency_properties, start, stop)
+            component(
+                block_state,
+                timestep,
+                out_tendencies=block_tendencies,
+                out_diagnostics=block_diagnostics,
+            )
+        else:
+            component(block_state, out=block_diagnostics)
+
+    def get_block(
+        self, fields: DataArrayDict, properties: PropertyDict, start: int, stop: int
+    ) -> DataArrayDict:
+        """Extract the columns ``start`` to ``stop`` (excluded) of ``fields`` as views."""
+        grid = self.get_grid(stop - start)
+        out = {}
+        for name, field in fields.items():
+            if name not in properties:
+                out[name] = field
+                continue
+            grid_id = properties[name]["grid"]
+            dims = self.computational_grid.grids[grid_id].dims
+            if "x" not in dims:
+                out[name] = field
+                continue
+            buffer = field.data
+            axis = dims.index("x")
+            slc = (slice(None),) * axis + (slice(start, stop),)
+            out[name] = get_data_array(
+                buffer[slc],
+                grid,
+                grid_id,
+                field.attrs["units"],
+                data_dims=tuple(field.dims[len(dims) :]),
+            )
+        return out
+
+    def allocate_outputs(self, properties: PropertyDict) -> DataArrayDict:
+        """Allocate the output fields over the whole computational grid."""
+        out = {}
+        for name, field_prop in properties.items():
+            buffer = zeros(
+                self.computational_grid,
+                field_prop["grid"],
+                get_data_shape_from_name(name),
+                gt4py_config=self.gt4py_config,
+                dtype=get_dtype_from_name(name),
+            )
+            out[name] = get_data_array(
+                buffer,
+                self.computational_grid,
+                field_prop["grid"],
+                field_prop["units"],
+                data_dims=field_prop.get("data_dims", None),
+            )
+        return out
+
+
+# state of the worker processes of ``ProcessPoolComponent``
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_worker(
+    component_factory: Callable[[ComputationalGrid], Component], ny: int, nz: int
+) -> None:
+    _WORKER_STATE["component_factory"] = component_factory
+    _WORKER_STATE["ny"] = ny
+    _WORKER_STATE["nz"] = nz
+    _WORKER_STATE["components"] = {}
+
+
+def _attach_fields(
+    infos: Dict[str, SharedFieldInfo], computational_grid: ComputationalGrid, start: int, stop: int
+) -> DataArrayDict:
+    out = {}
+    for name, (info, grid_id, units, data_dims, sliced) in infos.items():
+        out[name] = attach_shared_data_array(
+            info,
+            computational_grid,
+            grid_id,
+            units,
+            data_dims=data_dims,
+            column_slice=slice(start, stop) if sliced else None,
+        )
+    return out
+
+
+def _run_block_in_worker(
+    start: int,
+    stop: int,
+    timestep: Optional[timedelta],
+    state_infos: Dict[str, SharedFieldInfo],
+    state_others: Dict[str, Any],
+    tendency_infos: Dict[str, SharedFieldInfo],
+    diagnostic_infos: Dict[str, SharedFieldInfo],
+) -> None:
+    num_cols = stop - start
+    components = _WORKER_STATE["components"]
+    if num_cols not in components:
+        computational_grid = ComputationalGrid(num_cols, _WORKER_STATE["ny"], _WORKER_STATE["nz"])
+        components[num_cols] = _WORKER_STATE["component_factory"](computational_grid)
+    component = components[num_cols]
+    computational_grid = component.computational_grid
+
+    state = _attach_fields(state_infos, computational_grid, start, stop)
+    state.update(state_others)
+    diagnostics = _attach_fields(diagnostic_infos, computational_grid, start, stop)
+    if isinstance(component, ImplicitTendencyComponent):
+        tendencies = _attach_fields(tendency_infos, computational_grid, start, stop)
+        component(state, timestep, out_tendencies=tendencies, out_diagnostics=diagnostics)
+    else:
+        component(state, out=diagnostics)
+
+
+class ProcessPoolComponent(ColumnChunkedComponent):
+    """
+    Run a component over ``num_workers`` blocks of columns of ``computational_grid`` in parallel,
+    using a pool of processes.
+
+    Each worker process builds its own component instances, and attaches to the columns it is
+    responsible for of the fields living in shared memory (see ``storage.shared_memory_zeros``).
+    Outputs are written in place into shared memory, so that no gather is needed. Input fields
+    not allocated in shared memory are copied into shared staging buffers at each call; allocate
+    the state with ``shared_memory=True`` to avoid the copy. Array-like state entries which are
+    not inputs of the component are not forwarded to the workers.
+
+    Unless ``out_tendencies`` and ``out_diagnostics`` are given, outputs are allocated once and
+    overwritten at each call.
+
+    ``component_factory`` must be picklable, e.g. a module-level function or a
+    ``functools.partial`` thereof.
+    """
+
+    def __init__(
+        self,
+        component_factory: Callable[[ComputationalGrid], Component],
+        computational_grid: ComputationalGrid,
+        *,
+        num_workers: int,
+        gt4py_config: GT4PyConfig,
+    ) -> None:
+        nx = computational_grid.grids[I, J, K].shape[0]
+        super().__init__(
+            component_factory,
+            computational_grid,
+            block_size=-(-nx // num_workers),
+            gt4py_config=gt4py_config,
+            num_threads=1,
+        )
+        self.num_workers = num_workers
+        self._staging: Dict[str, np.ndarray] = {}
+        self._tendencies: Optional[DataArrayDict] = None
+        self._diagnostics: Optional[DataArrayDict] = None
+        self._process_executor = ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_worker,
+            initargs=(component_factory, self._ny, self._nz),
+        )
+
+    def __call__(
+        self,
+        state: DataArrayDict,
+        timestep: Optional[timedelta] = None,
+        *,
+        out_tendencies: Optional[DataArrayDict] = None,
+        out_diagnostics: Optional[DataArrayDict] = None,
+    ) -> Union[DataArrayDict, Tuple[DataArrayDict, DataArrayDict]]:
+        is_tendency_component = isinstance(self.component, ImplicitTendencyComponent)
+        if out_tendencies is None and is_tendency_component:
+            if self._tendencies is None:
+                self._tendencies = self.allocate_outputs(self.tendency_properties)
+            out_tendencies = self._tendencies
+        tendencies = out_tendencies or {}
+        if out_diagnostics is None:
+            if self._diagnostics is None:
+                self._diagnostics = self.allocate_outputs(self.diagnostic_properties)
+            out_diagnostics = self._diagnostics
+        diagnostics = out_diagnostics
+
+        state_infos = self.get_shared_field_infos(state, self.input_properties, staging=True)
+        # forward scalar entries only (e.g. 'time'): fields not listed as inputs are not needed
+        state_others = {
+            name: value
+            for name, value in state.items()
+            if name not in state_infos and getattr(value, "ndim", 0) == 0
+        }
+        tendency_infos = self.get_shared_field_infos(tendencies, self.tendency_properties)
+        diagnostic_infos = self.get_shared_field_infos(diagnostics, self.diagnostic_properties)
+
+        futures = [
+            self._process_executor.submit(
+                _run_block_in_worker,
+                start,
+                stop,
+                timestep,
+                state_infos,
+                state_others,
+                tendency_infos,
+                diagnostic_infos,
+            )
+            for start, stop in self.blocks
+        ]
+        for future in futures:
+            future.result()
+
+        if is_tendency_component:
+            return tendencies, diagnostics
+        else:
+            return diagnostics
+
+    def get_shared_field_infos(
+        self, fields: DataArrayDict, properties: PropertyDict, staging: bool = False
+    ) -> Dict[str, SharedFieldInfo]:
+        """
+        Describe the fields in ``fields`` listed in ``properties``. If ``staging`` is ``True``,
+        fields not living in shared memory are copied into shared staging buffers.
+        """
+        out = {}
+        for name, field_prop in properties.items():
+            if name not in fields:
+                continue
+            field = fields[name]
+            buffer = field.data
+            try:
+                info = get_shared_storage_info(buffer)
+            except ValueError:
+                if not staging:
+                    raise
+                if name not in self._staging or self._staging[name].shape != buffer.shape:
+                    self._staging[name] = shared_memory_zeros(
+                        buffer.shape, buffer.dtype, backend=self.gt4py_config.backend
+                    )
+                self._staging[name][...] = buffer
+                info = get_shared_storage_info(self._staging[name])
+            grid_id = field_prop["grid"]
+            grid_dims = self.computational_grid.grids[grid_id].dims
+            out[name] = (
+                info,
+                grid_id,
+                field.attrs["units"],
+                tuple(field.dims[len(grid_dims) :]),
+                "x" in grid_dims,
+            )
+        return out
+
+    def allocate_outputs(self, properties: PropertyDict) -> DataArrayDict:
+        """Allocate the output fields over the whole computational grid in shared memory."""
+        out = {}
+        for name, field_prop in properties.items():
+            buffer = zeros(
+                self.computational_grid,
+                field_prop["grid"],
+                get_data_shape_from_name(name),
+                gt4py_config=self.gt4py_config,
+                dtype=get_dtype_from_name(name),
+                shared_memory=True,
+            )
+            out[name] = get_data_array(
+                buffer,
+                self.computational_grid,
+                field_prop["grid"],
+                field_prop["units"],
+                data_dims=field_prop.get("data_dims", None),
+            )
+        return out
+
+    def shutdown(self) -> None:
+        """Shut down the pool of processes."""
+        self._process_executor.shutdown()
+        super().shutdown()
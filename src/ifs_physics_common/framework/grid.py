@@ -21,7 +21,9 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from collections.abc import Hashable
-    from typing import Dict, Optional, Tuple
+    from typing import Any, Dict, Optional, Tuple, Type
+
+    from ifs_physics_common.framework.communication import Communicator
 
 
 class DimSymbol:
@@ -42,6 +44,10 @@ class DimSymbol:
         self.name = name
         self.offset = offset
 
+    def __reduce__(self) -> Tuple[Type[DimSymbol], Tuple[str, float]]:
+        # ensure unpickled symbols are the unique instances of the current process
+        return DimSymbol, (self.name, self.offset)
+
     def __add__(self, other: float) -> DimSymbol:
         return DimSymbol(self.name, self.offset + other)
 
@@ -78,7 +84,11 @@ class Grid:
 
     @cached_property
     def coords(self) -> Tuple[np.ndarray, ...]:
-        return tuple(np.arange(size) for size in self.storage_shape)
+        out = tuple(np.arange(size) for size in self.storage_shape)
+        for coord in out:
+            # coordinates are shared by all data arrays defined over the grid
+            coord.flags.writeable = False
+        return out
 
 
 class ComputationalGrid:
@@ -93,3 +103,57 @@ class ComputationalGrid:
             (I, J): Grid((nx, ny), ("x", "y")),
             (K,): Grid((nz,), ("z",), (nz + 1,)),
         }
+
+
+class DecomposedComputationalGrid(ComputationalGrid):
+    """
+    Portion of a global computational grid of ``nx * ny * nz`` points owned by the rank ``rank``
+    out of ``num_ranks``, when columns are partitioned over ranks along the first horizontal
+    dimension.
+
+    ``grids`` describe the local portion, ``global_grids`` describe the global domain, and
+    ``offset`` is the global index of the first local point.
+    """
+
+    def __init__(self, nx: int, ny: int, nz: int, *, num_ranks: int, rank: int) -> None:
+        assert 0 <= rank < num_ranks
+        self.num_ranks = num_ranks
+        self.rank = rank
+        self.global_grids = ComputationalGrid(nx, ny, nz).grids
+        self.start, self.stop = self.get_bounds(nx, num_ranks, rank)
+        self.offset = (self.start, 0, 0)
+        super().__init__(self.stop - self.start, ny, nz)
+
+    @classmethod
+    def from_communicator(
+        cls, nx: int, ny: int, nz: int, comm: Communicator
+    ) -> DecomposedComputationalGrid:
+        return cls(nx, ny, nz, num_ranks=comm.size, rank=comm.rank)
+
+    @staticmethod
+    def get_bounds(nx: int, num_ranks: int, rank: int) -> Tuple[int, int]:
+        """First and last (excluded) global index of the columns owned by ``rank``."""
+        return nx * rank // num_ranks, nx * (rank + 1) // num_ranks
+
+    def get_local_slice(self, grid_id: Hashable) -> Tuple[slice, ...]:
+        """Index selecting the local portion of a global array defined over ``grid_id``."""
+        return tuple(
+            slice(self.start, self.stop) if dim == "x" else slice(None)
+            for dim in self.grids[grid_id].dims
+        )
+
+    def get_local_field(self, field: np.ndarray, grid_id: Hashable) -> np.ndarray:
+        """View of the local portion of the global array ``field`` defined over ``grid_id``."""
+        return field[self.get_local_slice(grid_id)]
+
+    def get_local_state(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Views of the local portion of the global fields of ``state``. Data arrays spanning the
+        first horizontal dimension are sliced along it, all other entries are passed as they are.
+        """
+        return {
+            name: value.isel(x=slice(self.start, self.stop))
+            if "x" in getattr(value, "dims", ())
+            else value
+            for name, value in state.items()
+        }
@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2022-2024 ETH Zurich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+import os
+from typing import TYPE_CHECKING
+
+from ifs_physics_common.framework.components import ImplicitTendencyComponent
+from ifs_physics_common.framework.storage import (
+    get_data_array,
+    get_data_shape_from_name,
+    get_dtype_from_name,
+    zeros,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import timedelta
+    from typing import Any, Dict, List, Literal, Optional, Set, Tuple
+
+    from sympl._core.data_array import DataArray
+    from sympl._core.typingx import DataArrayDict
+
+    from ifs_physics_common.framework.config import GT4PyConfig
+    from ifs_physics_common.framework.execution import Component
+    from ifs_physics_common.framework.grid import ComputationalGrid, DimSymbol
+    from ifs_physics_common.utils.typingx import NDArrayLike
+
+    # a value is a field produced by a component, identified by the index of the component
+    Value = Tuple[int, str]
+    # grid, datatype and data shape of a buffer
+    SlotKey = Tuple[Tuple[DimSymbol, ...], Literal["bool", "float", "int"], Tuple[int, ...]]
+
+
+class ComponentPipeline:
+    """
+    Run a sequence of components as a dataflow graph.
+
+    The graph is built from the properties of the components: a component depends on any earlier
+    component diagnosing one of its inputs. All diagnostics are written into buffers owned by the
+    pipeline, which are exposed to the downstream components without any copy. A buffer is
+    recycled as soon as its last consumer has run, for another diagnostic of the same grid,
+    datatype and data shape. The intermediate diagnostics are thus not retained after the call.
+
+    ``outputs`` lists the diagnostics returned by each call. By default, these are the
+    diagnostics which are not consumed by any later component. The returned diagnostics and the
+    tendencies are overwritten by the next call.
+
+    If ``num_workers`` is larger than one, the components are grouped into stages of mutually
+    independent components, and the components of each stage run concurrently on a pool of
+    ``num_workers`` threads. By default, the ``num_threads`` threads of ``gt4py_config`` are split
+    between the concurrent components and the OpenMP threads of each stencil, as set by
+    ``OMP_NUM_THREADS``. Buffers are then recycled only across stages.
+
+    If ``accumulate_tendencies`` is ``True``, all tendency components write into a single set of
+    tendencies through ``accumulate_into``: the first component computing a tendency overwrites
+    it, and the following ones add to it. Components sharing a tendency never run concurrently.
+    """
+
+    def __init__(
+        self,
+        components: Sequence[Component],
+        computational_grid: ComputationalGrid,
+        *,
+        gt4py_config: GT4PyConfig,
+        outputs: Optional[Sequence[str]] = None,
+        num_workers: Optional[int] = None,
+        accumulate_tendencies: bool = False,
+    ) -> None:
+        self.components = list(components)
+        self.computational_grid = computational_grid
+        self.gt4py_config = gt4py_config
+        if num_workers is None:
+            num_omp_threads = int(os.environ.get("OMP_NUM_THREADS", 1))
+            num_workers = max(1, gt4py_config.num_threads // max(1, num_omp_threads))
+        self.num_workers = num_workers
+        self.accumulate_tendencies = accumulate_tendencies
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self.dependencies, consumers = self.get_dependencies()
+        self.stages = self.get_stages()
+        if outputs is None:
+            outputs = [
+                name
+                for (index, name), value_consumers in consumers.items()
+                if len(value_consumers) == 0
+            ]
+        self.outputs = tuple(dict.fromkeys(outputs))
+        self.slots, self.slot_keys = self.plan_slots(consumers)
+
+        self._buffers: List[NDArrayLike] = []
+        self._out_tendencies: List[DataArrayDict] = []
+        self._out_diagnostics: List[DataArrayDict] = []
+        self._overwrite_tendencies: List[Optional[Dict[str, bool]]] = []
+        self._accumulated_tendencies: DataArrayDict = {}
+
+    @property
+    def num_bytes(self) -> int:
+        """Number of bytes held by the buffers of the diagnostics and the tendencies."""
+        out = sum(buffer.nbytes for buffer in self._buffers)
+        tendencies = {
+            id(field): field for fields in self._out_tendencies for field in fields.values()
+        }
+        out += sum(field.data.nbytes for field in tendencies.values())
+        return out  # type: ignore[no-any-return]
+
+    def get_dependencies(self) -> Tuple[List[Set[int]], Dict[Value, List[int]]]:
+        """
+        Get the indices of the components each component depends on, and the indices of the
+        components consuming each value.
+
+        Besides reading a diagnostic of an earlier component, a component depends on any earlier
+        component reading or diagnosing a field which it diagnoses itself, and, if
+        ``accumulate_tendencies`` is ``True``, on any earlier component computing one of its
+        tendencies.
+        """
+        dependencies: List[Set[int]] = []
+        consumers: Dict[Value, List[int]] = {}
+        producers: Dict[str, int] = {}
+        readers: Dict[str, List[int]] = {}
+        writers: Dict[str, int] = {}
+        for index, component in enumerate(self.components):
+            component_dependencies = set()
+            for name in component.input_properties:
+                if name in producers:
+                    component_dependencies.add(producers[name])
+                    consumers[producers[name], name].append(index)
+                readers.setdefault(name, []).append(index)
+            for name in component.diagnostic_properties:
+                if name in producers:
+                    component_dependencies.add(producers[name])
+                component_dependencies.update(readers.get(name, []))
+            if self.accumulate_tendencies:
+                for name in getattr(component, "tendency_properties", {}):
+                    if name in writers:
+                        component_dependencies.add(writers[name])
+                    writers[name] = index
+            component_dependencies.discard(index)
+            dependencies.append(component_dependencies)
+            for name in component.diagnostic_properties:
+                producers[name] = index
+                consumers[index, name] = []
+        return dependencies, consumers
+
+    def get_stages(self) -> List[List[int]]:
+        """
+        Group the indices of the components into stages to be run one after the other. If
+        ``num_workers`` is larger than one, each stage gathers the components at the same depth
+        of the dependency graph. Otherwise, each stage consists of a single component.
+        """
+        if self.num_workers <= 1:
+            return [[index] for index in range(len(self.components))]
+
+        depths: List[int] = []
+        for component_dependencies in self.dependencies:
+            depths.append(1 + max((depths[index] for index in component_dependencies), default=-1))
+        stages: List[List[int]] = [[] for _ in range(max(depths, default=-1) + 1)]
+        for index, depth in enumerate(depths):
+            stages[depth].append(index)
+        return stages
+
+    def plan_slots(
+        self, consumers: Dict[Value, List[int]]
+    ) -> Tuple[Dict[Value, int], List[SlotKey]]:
+        """
+        Assign a buffer (slot) to each value, so that values whose lifetimes do not overlap share
+        the same buffer whenever they have the same grid, datatype and data shape. Lifetimes are
+        measured in stages. Return the slot of each value, and the grid, datatype and data shape
+        of each slot.
+        """
+        stage_of = {index: stage for stage, indices in enumerate(self.stages) for index in indices}
+        last_producer: Dict[str, int] = {}
+        for index, name in consumers:
+            last_producer[name] = max(index, last_producer.get(name, index))
+
+        # the returned diagnostics live until the end of the call
+        end = len(self.stages)
+        last_use = {}
+        for (index, name), value_consumers in consumers.items():
+            if name in self.outputs and last_producer[name] == index:
+                last_use[index, name] = end
+            else:
+                last_use[index, name] = max(
+                    (stage_of[consumer] for consumer in value_consumers), default=stage_of[index]
+                )
+
+        slots: Dict[Value, int] = {}
+        slot_keys: List[SlotKey] = []
+        free_slots: Dict[SlotKey, List[int]] = {}
+        live: List[Value] = []
+        for stage, indices in enumerate(self.stages):
+            for value in [value for value in live if last_use[value] < stage]:
+                live.remove(value)
+                slot = slots[value]
+                free_slots.setdefault(slot_keys[slot], []).append(slot)
+            for index in indices:
+                for name, field_prop in self.components[index].diagnostic_properties.items():
+                    key: SlotKey = (
+                        field_prop["grid"],
+                        get_dtype_from_name(name),
+                        get_data_shape_from_name(name),
+                    )
+                    if len(free_slots.get(key, [])) > 0:
+                        slots[index, name] = free_slots[key].pop()
+                    else:
+                        slots[index, name] = len(slot_keys)
+                        slot_keys.append(key)
+                    live.append((index, name))
+        return slots, slot_keys
+
+    def allocate(self) -> None:
+        """Allocate the buffers of the diagnostics and the tendencies."""
+        self._buffers = [
+            zeros(
+                self.computational_grid,
+                grid_id,
+                data_shape,
+                gt4py_config=self.gt4py_config,
+                dtype=dtype,
+            )
+            for grid_id, dtype, data_shape in self.slot_keys
+        ]
+        self._out_diagnostics = []
+        self._out_tendencies = []
+        self._overwrite_tendencies = []
+        self._accumulated_tendencies = {}
+        for index, component in enumerate(self.components):
+            self._out_diagnostics.append(
+                {
+                    name: self.wrap(self._buffers[self.slots[index, name]], field_prop)
+                    for name, field_prop in component.diagnostic_properties.items()
+                }
+            )
+            tendency_properties = getattr(component, "tendency_properties", {})
+            if self.accumulate_tendencies:
+                overwrite_tendencies = {}
+                for name, field_prop in tendency_properties.items():
+                    overwrite_tendencies[name] = name not in self._accumulated_tendencies
+                    if overwrite_tendencies[name]:
+                        self._accumulated_tendencies[name] = self.wrap(
+                            self.allocate_buffer(name, field_prop), field_prop
+                        )
+                self._out_tendencies.append(
+                    {name: self._accumulated_tendencies[name] for name in tendency_properties}
+                )
+                self._overwrite_tendencies.append(overwrite_tendencies)
+            else:
+                self._out_tendencies.append(
+                    {
+                        name: self.wrap(self.allocate_buffer(name, field_prop), field_prop)
+                        for name, field_prop in tendency_properties.items()
+                    }
+                )
+                self._overwrite_tendencies.append(None)
+
+    def allocate_buffer(self, name: str, field_prop: Dict[str, Any]) -> NDArrayLike:
+        return zeros(
+            self.computational_grid,
+            field_prop["grid"],
+            get_data_shape_from_name(name),
+            gt4py_config=self.gt4py_config,
+            dtype=get_dtype_from_name(name),
+        )
+
+    def wrap(self, buffer: NDArrayLike, field_prop: Dict[str, Any]) -> DataArray:
+        return get_data_array(
+            buffer,
+            self.computational_grid,
+            field_prop["grid"],
+            field_prop["units"],
+            data_dims=field_prop.get("data_dims", None),
+        )
+
+    def __call__(
+        self, state: DataArrayDict, timestep: Optional[timedelta] = None
+    ) -> Tuple[List[DataArrayDict], DataArrayDict]:
+        """
+        Run all components over ``state``. Return the tendencies of each tendency component, in
+        the order of the components, and the diagnostics listed in ``outputs``. If
+        ``accumulate_tendencies`` is ``True``, the accumulated tendencies are returned in place of
+        the tendencies of each component.
+        """
+        if len(self._out_diagnostics) == 0:
+            self.allocate()
+
+        current = dict(state)
+        results: Dict[int, Optional[DataArrayDict]] = {}
+        for indices in self.stages:
+            if len(indices) > 1:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.num_workers, thread_name_prefix="pipeline"
+                    )
+                futures = {
+                    index: self._executor.submit(self.run_component, index, current, timestep)
+                    for index in indices
+                }
+                for index, future in futures.items():
+                    results[index] = future.result()
+            else:
+                results[indices[0]] = self.run_component(indices[0], current, timestep)
+            for index in indices:
+                current.update(self._out_diagnostics[index])
+
+        tendencies = []
+        if self.accumulate_tendencies:
+            if len(self._accumulated_tendencies) > 0:
+                tendencies.append(self._accumulated_tendencies)
+        else:
+            for index in sorted(results):
+                component_tendencies = results[index]
+                if component_tendencies is not None:
+                    tendencies.append(component_tendencies)
+        diagnostics = {name: current[name] for name in self.outputs}
+        return tendencies, diagnostics
+
+    def shutdown(self) -> None:
+        """Shut down the pool of threads, if any."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def run_component(
+        self, index: int, state: DataArrayDict, timestep: Optional[timedelta]
+    ) -> Optional[DataArrayDict]:
+        """Run the ``index``-th component, writing its outputs into the pipeline buffers."""
+        component = self.components[index]
+        if isinstance(component, ImplicitTendencyComponent) and self.accumulate_tendencies:
+            tendencies, _ = component(
+                state,
+                timestep,
+                out_diagnostics=self._out_diagnostics[index],
+                overwrite_tendencies=self._overwrite_tendencies[index],
+                accumulate_into=self._out_tendencies[index],
+            )
+            return tendencies
+        elif isinstance(component, ImplicitTendencyComponent):
+            tendencies, _ = component(
+                state,
+                timestep,
+                out_tendencies=self._out_tendencies[index],
+                out_diagnostics=self._out_diagnostics[index],
+            )
+            return tendencies
+        else:
+            component(state, out=self._out_diagnostics[index])
+            return None
+
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2022-2024 ETH Zurich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import importlib
+import json
+import os
+import sys
+from typing import TYPE_CHECKING
+
+from ifs_physics_common.framework.config import DataTypes, GT4PyConfig
+from ifs_physics_common.framework.stencil import STENCIL_COLLECTION, compile_stencil
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from concurrent.futures import Future
+    from typing import Any, Dict, Optional
+
+
+def _import_modules(modules: Sequence[str]) -> None:
+    """Import the modules registering stencils and functions in the collections."""
+    for module in modules:
+        importlib.import_module(module)
+
+
+def _precompile_stencil(
+    name: str, gt4py_config: GT4PyConfig, externals: Optional[Dict[str, Any]]
+) -> None:
+    compile_stencil(name, gt4py_config, externals)
+
+
+def precompile_all(
+    gt4py_config: GT4PyConfig,
+    externals_by_name: Optional[Dict[str, Dict[str, Any]]] = None,
+    max_workers: Optional[int] = None,
+    *,
+    modules: Sequence[str] = (),
+    names: Optional[Sequence[str]] = None,
+) -> Dict[str, Optional[BaseException]]:
+    """
+    Compile all stencils in ``STENCIL_COLLECTION`` concurrently over a pool of processes.
+
+    The stencil ``name`` is compiled with the externals ``externals_by_name[name]``, if any.
+    ``modules`` are imported by each worker before compiling, so to populate the stencil and
+    function collections also when worker processes are not forked from the current one. The
+    compiled stencils end up in the build cache of GT4Py, or in the on-disk stencil cache if
+    ``gt4py_config.stencil_cache_dir`` is set, where they can be picked up by later runs.
+
+    Return a dictionary mapping the name of each stencil to the exception raised while compiling
+    it, or ``None`` on success.
+    """
+    _import_modules(modules)
+    gt4py_config = gt4py_config.with_lazy_compilation(False)
+    externals_by_name = externals_by_name or {}
+    names = names if names is not None else sorted(STENCIL_COLLECTION.keys())
+
+    futures: Dict[str, Future] = {}
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_import_modules, initargs=(tuple(modules),)
+    ) as executor:
+        for name in names:
+            futures[name] = executor.submit(
+                _precompile_stencil, name, gt4py_config, externals_by_name.get(name, None)
+            )
+
+    return {name: future.exception() for name, future in futures.items()}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Console entry point of ``precompile_all``."""
+    parser = argparse.ArgumentParser(
+        description="Compile all registered GT4Py stencils ahead of time."
+    )
+    parser.add_argument("--backend", type=str, required=True, help="GT4Py backend.")
+    parser.add_argument(
+        "--precision", type=str, choices=("double", "single"), default="double", help="Precision."
+    )
+    parser.add_argument(
+        "-m",
+        "--module",
+        dest="modules",
+        action="append",
+        default=[],
+        help="Module registering stencils. Can be specified multiple times.",
+    )
+    parser.add_argument(
+        "--externals",
+        type=str,
+        default=None,
+        help="JSON file mapping the name of each stencil to its externals.",
+    )
+    parser.add_argument(
+        "--stencil-cache-dir", type=str, default=None, help="Root of the on-disk stencil cache."
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Number of worker processes. Default to the number of processors.",
+    )
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild all stencils.")
+    args = parser.parse_args(argv)
+
+    externals_by_name = None
+    if args.externals is not None:
+        with open(args.externals, "r") as f:
+            externals_by_name = json.load(f)
+
+    gt4py_config = GT4PyConfig(
+        backend=args.backend,
+        dtypes=DataTypes.with_precision(args.precision),
+        rebuild=args.rebuild,
+        stencil_cache_dir=args.stencil_cache_dir,
+        verbose=False,
+    )
+    sys.path.insert(0, os.getcwd())
+    errors = precompile_all(
+        gt4py_config, externals_by_name, max_workers=args.max_workers, modules=args.modules
+    )
+
+    num_failures = 0
+    for name, error in errors.items():
+        if error is None:
+            print(f"   - {name:40s}: compiled")
+        else:
+            num_failures += 1
+            print(f"   - {name:40s}: \033[91mfailed\033[00m ({type(error).__name__}: {error})")
+    print(f"== Compiled {len(errors) - num_failures} out of {len(errors)} stencils.")
+
+    return 0 if num_failures == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,13 +15,26 @@
 # limitations under the License.
 
 from __future__ import annotations
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+import hashlib
+import inspect
+import json
+import os
+import sysconfig
+import threading
+import time
+from types import CodeType, FunctionType
 from typing import TYPE_CHECKING
 
+import gt4py
 from gt4py.cartesian import gtscript
 
+from ifs_physics_common.framework.stencil_cache import StencilCache
+
 if TYPE_CHECKING:
-    from collections.abc import Callable
-    from typing import Any, Dict, Optional
+    from collections.abc import Callable, Hashable, Iterator
+    from concurrent.futures import Executor
+    from typing import Any, Dict, List, Literal, Optional, Set
 
     from gt4py.cartesian import StencilObject
 
@@ -31,6 +44,49 @@ if TYPE_CHECKING:
 FUNCTION_COLLECTION = {}
 STENCIL_COLLECTION = {}
 
+COMPILED_STENCILS: Dict[Hashable, StencilObject] = {}
+COMPILED_STENCILS_STATS = {"hits": 0, "misses": 0}
+_COMPILED_STENCILS_LOCK = threading.Lock()
+_PENDING_STENCILS: Dict[Hashable, Future] = {}
+
+COMPILATION_EXECUTORS: Dict[str, Executor] = {}
+
+# GT4Py builds mutate process-global state (distutils configuration, redirected standard streams),
+# hence at most one build may run at a time within a process
+_BUILD_LOCK = threading.Lock()
+
+
+def _reset_locks() -> None:
+    # a forked process (e.g. a worker of the process compilation executor) inherits the locks in
+    # the state they had in the parent, and may thus find them held by threads it does not have
+    global _BUILD_LOCK, _COMPILED_STENCILS_LOCK
+    _BUILD_LOCK = threading.Lock()
+    _COMPILED_STENCILS_LOCK = threading.Lock()
+    _PENDING_STENCILS.clear()
+    COMPILATION_EXECUTORS.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_locks)
+
+# environment variables affecting the compilation of the generated extension modules
+BUILD_ENVIRONMENT_VARIABLES = (
+    "BOOST_ROOT",
+    "CC",
+    "CFLAGS",
+    "CUDA_HOME",
+    "CXX",
+    "CXXFLAGS",
+    "GT4PY_EXTRA_COMPILE_ARGS",
+    "GT4PY_EXTRA_LINK_ARGS",
+    "LDFLAGS",
+)
+
+STENCIL_BUILD_RECORDS: List[Dict[str, Any]] = []
+
+# phases of the compilation of a stencil timed by GT4Py in ``build_info``
+GT4PY_BUILD_PHASES = ("parse_time", "module_time", "codegen_time", "build_time", "load_time")
+
 
 def function_collection(name: str) -> Callable[[Callable], Callable]:
     """Decorator for GT4Py functions."""
@@ -56,16 +112,417 @@ def stencil_collection(name: str) -> Callable[[Callable], Callable]:
     return core
 
 
+def _get_source(obj: Any) -> str:
+    try:
+        return inspect.getsource(obj)
+    except (OSError, TypeError):
+        return repr(obj)
+
+
+def _iter_names(code: CodeType) -> Iterator[str]:
+    yield from code.co_names
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            yield from _iter_names(const)
+
+
+def _get_used_functions(definition: Callable, externals: Dict[str, Any]) -> List[Callable]:
+    """
+    Collect the functions from ``FUNCTION_COLLECTION`` which are used by ``definition``, either
+    directly or through other functions, plus all functions passed as ``externals``.
+    """
+    collection = {id(info["definition"]) for info in FUNCTION_COLLECTION.values()}
+    out: List[Callable] = []
+    visited: Set[int] = set()
+    queue = [value for value in externals.values() if isinstance(value, FunctionType)]
+    queue.append(definition)
+    while len(queue) > 0:
+        func = queue.pop()
+        if id(func) in visited:
+            continue
+        visited.add(id(func))
+        if func is not definition:
+            out.append(func)
+        code = getattr(func, "__code__", None)
+        if code is None:
+            continue
+        func_globals = getattr(func, "__globals__", {})
+        for name in _iter_names(code):
+            value = func_globals.get(name, None)
+            if id(value) in collection:
+                queue.append(value)
+    return sorted(out, key=lambda func: func.__qualname__)
+
+
+def _normalize_external(value: Any) -> Any:
+    if isinstance(value, FunctionType):
+        return f"{value.__module__}.{value.__qualname__}"
+    elif isinstance(value, dict):
+        return {str(key): _normalize_external(val) for key, val in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return [_normalize_external(val) for val in value]
+    else:
+        return repr(value)
+
+
+def _get_build_environment() -> str:
+    return json.dumps(
+        {
+            "gt4py": gt4py.__version__,
+            "ext_suffix": sysconfig.get_config_var("EXT_SUFFIX"),
+            "env": {name: os.environ.get(name) for name in BUILD_ENVIRONMENT_VARIABLES},
+        },
+        sort_keys=True,
+    )
+
+
+def get_stencil_key(
+    name: str, gt4py_config: GT4PyConfig, externals: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Compute a content hash identifying the stencil ``name`` compiled with ``gt4py_config``
+    and ``externals``.
+
+    The hash accounts for the source code of the stencil definition and of all the functions it
+    uses, the datatypes, the backend and the backend options, the version of GT4Py, the ABI of
+    the Python interpreter, and the environment variables controlling the compiler.
+    """
+    stencil_info = STENCIL_COLLECTION.get(name, None)
+    if stencil_info is None:
+        raise RuntimeError(f"Unknown stencil `{name}`.")
+    definition = stencil_info["definition"]
+    externals = externals or {}
+
+    hasher = hashlib.sha256()
+    hasher.update(name.encode())
+    hasher.update(_get_source(definition).encode())
+    for func in _get_used_functions(definition, externals):
+        hasher.update(_get_source(func).encode())
+    hasher.update(gt4py_config.get_fingerprint().encode())
+    hasher.update(_get_build_environment().encode())
+    hasher.update(json.dumps(_normalize_external(externals), sort_keys=True).encode())
+    return f"{name}_{hasher.hexdigest()[:32]}"
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), _freeze(val)) for key, val in value.items()))
+    elif isinstance(value, (list, tuple)):
+        return tuple(_freeze(val) for val in value)
+    try:
+        hash(value)
+    except TypeError:
+        return (type(value).__name__, repr(value))
+    # e.g. 1, 1.0 and True compare equal, yet GTScript generates different code for each
+    return (type(value).__name__, value)
+
+
+def get_compiled_stencils_stats() -> Dict[str, int]:
+    """Return the number of hits and misses of ``COMPILED_STENCILS``, and its size."""
+    with _COMPILED_STENCILS_LOCK:
+        return {**COMPILED_STENCILS_STATS, "size": len(COMPILED_STENCILS)}
+
+
+def invalidate_compiled_stencils(name: Optional[str] = None) -> None:
+    """
+    Remove the stencil ``name`` from ``COMPILED_STENCILS`` for any choice of externals and
+    configuration. If ``name`` is not given, remove all stencils and reset the counters.
+    """
+    with _COMPILED_STENCILS_LOCK:
+        if name is None:
+            COMPILED_STENCILS.clear()
+            COMPILED_STENCILS_STATS.update(hits=0, misses=0)
+        else:
+            for key in [key for key in COMPILED_STENCILS if key[0] == name]:  # type: ignore[index]
+                COMPILED_STENCILS.pop(key)
+
+
+class LazyStencilObject:
+    """
+    Proxy of a ``StencilObject`` which defers the compilation of the stencil until first use.
+
+    If ``background`` is ``True``, the compilation is submitted straight away to the shared
+    compilation executor (see ``submit_stencil``), and first use only blocks until the
+    compilation is over.
+    """
+
+    __slots__ = ("name", "gt4py_config", "externals", "_future", "_stencil_object", "_lock")
+
+    def __init__(
+        self,
+        name: str,
+        gt4py_config: GT4PyConfig,
+        externals: Optional[Dict[str, Any]] = None,
+        *,
+        background: bool = False,
+    ) -> None:
+        self.name = name
+        self.gt4py_config = gt4py_config
+        self.externals = externals
+        self._future: Optional[Future] = None
+        self._stencil_object: Optional[StencilObject] = None
+        self._lock = threading.Lock()
+        if background:
+            self._future = submit_stencil(name, gt4py_config, externals)
+
+    @property
+    def stencil_object(self) -> StencilObject:
+        if self._stencil_object is None:
+            with self._lock:
+                if self._stencil_object is None:
+                    if self._future is not None:
+                        self._stencil_object = self._future.result()
+                    else:
+                        self._stencil_object = _compile_stencil(
+                            self.name, self.gt4py_config, self.externals
+                        )
+        return self._stencil_object
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.stencil_object(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        if name in LazyStencilObject.__slots__:
+            raise AttributeError(name)
+        return getattr(self.stencil_object, name)
+
+
+def get_compilation_executor(
+    kind: Literal["thread", "process"], max_workers: Optional[int] = None
+) -> Executor:
+    """
+    Get the executor of kind ``kind`` shared by all asynchronous compilations.
+
+    ``max_workers`` is only used when the executor is first created.
+    """
+    with _COMPILED_STENCILS_LOCK:
+        if kind not in COMPILATION_EXECUTORS:
+            if kind == "thread":
+                COMPILATION_EXECUTORS[kind] = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="compile_stencil"
+                )
+            elif kind == "process":
+                COMPILATION_EXECUTORS[kind] = ProcessPoolExecutor(max_workers=max_workers)
+            else:
+                raise ValueError(f"Unknown compilation executor `{kind}`.")
+        return COMPILATION_EXECUTORS[kind]
+
+
+def shutdown_compilation_executors(wait: bool = True) -> None:
+    """Shut down all executors created by ``get_compilation_executor``."""
+    with _COMPILED_STENCILS_LOCK:
+        executors = list(COMPILATION_EXECUTORS.values())
+        COMPILATION_EXECUTORS.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait)
+
+
+def submit_stencil(
+    name: str,
+    gt4py_config: GT4PyConfig,
+    externals: Optional[Dict[str, Any]] = None,
+) -> Future:
+    """
+    Compile a GT4Py stencil asynchronously, and return a future resolving to the stencil object.
+
+    The compilation runs on the shared executor of kind ``gt4py_config.compilation_executor``.
+    With a process pool, the stencil is built by a worker process, which populates the build
+    cache, and then loaded by the current process. With a thread pool, the GT4Py builds are
+    serialized, and only the cache lookups and loads overlap with each other and with the caller.
+    Multiple submissions of the same stencil share the same future.
+    """
+    stencil_info = STENCIL_COLLECTION.get(name, None)
+    if stencil_info is None:
+        raise RuntimeError(f"Unknown stencil `{name}`.")
+
+    key = _get_memo_key(name, gt4py_config, externals)
+    with _COMPILED_STENCILS_LOCK:
+        stencil_object = None if gt4py_config.rebuild else COMPILED_STENCILS.get(key, None)
+        if stencil_object is not None:
+            future: Future = Future()
+            future.set_result(stencil_object)
+            return future
+        if key in _PENDING_STENCILS:
+            return _PENDING_STENCILS[key]
+
+    thread_executor = get_compilation_executor("thread", gt4py_config.compilation_max_workers)
+    if gt4py_config.compilation_executor == "process":
+        process_executor = get_compilation_executor(
+            "process", gt4py_config.compilation_max_workers
+        )
+        future = thread_executor.submit(
+            _compile_stencil_in_process, process_executor, name, gt4py_config, externals
+        )
+    else:
+        future = thread_executor.submit(_compile_stencil, name, gt4py_config, externals)
+
+    with _COMPILED_STENCILS_LOCK:
+        future = _PENDING_STENCILS.setdefault(key, future)
+    future.add_done_callback(lambda _: _PENDING_STENCILS.pop(key, None))
+    return future
+
+
+def _compile_stencil_in_process(
+    executor: Executor,
+    name: str,
+    gt4py_config: GT4PyConfig,
+    externals: Optional[Dict[str, Any]] = None,
+) -> StencilObject:
+    executor.submit(_populate_build_cache, name, gt4py_config, externals).result()
+    return _compile_stencil(name, gt4py_config.with_rebuild(False), externals)
+
+
+def _populate_build_cache(
+    name: str, gt4py_config: GT4PyConfig, externals: Optional[Dict[str, Any]] = None
+) -> None:
+    _compile_stencil(name, gt4py_config, externals)
+
+
 def compile_stencil(
     name: str,
     gt4py_config: GT4PyConfig,
     externals: Optional[Dict[str, Any]] = None,
 ) -> StencilObject:
-    """Automate and customize the compilation of GT4Py stencils."""
+    """
+    Automate and customize the compilation of GT4Py stencils.
+
+    Stencil objects are memoized process-wide in ``COMPILED_STENCILS``, so that components
+    compiling the same stencil with the same externals and configuration share the same object.
+    If ``gt4py_config.stencil_cache_dir`` is set, stencils not found in memory are looked up in
+    the on-disk ``StencilCache`` rooted at that directory before being built.
+
+    If ``gt4py_config.lazy_compilation`` is enabled, stencils not found in memory are returned as
+    ``LazyStencilObject``s.
+    """
     stencil_info = STENCIL_COLLECTION.get(name, None)
     if stencil_info is None:
         raise RuntimeError(f"Unknown stencil `{name}`.")
-    definition = stencil_info["definition"]
+
+    if gt4py_config.lazy_compilation:
+        with _COMPILED_STENCILS_LOCK:
+            stencil_object = COMPILED_STENCILS.get(_get_memo_key(name, gt4py_config, externals))
+        if stencil_object is not None and not gt4py_config.rebuild:
+            return stencil_object
+        return LazyStencilObject(  # type: ignore[return-value]
+            name,
+            gt4py_config,
+            externals,
+            background=gt4py_config.lazy_compilation == "background",
+        )
+
+    return _compile_stencil(name, gt4py_config, externals)
+
+
+def _get_memo_key(
+    name: str, gt4py_config: GT4PyConfig, externals: Optional[Dict[str, Any]] = None
+) -> Hashable:
+    return name, _freeze(externals or {}), gt4py_config.get_fingerprint()
+
+
+def get_stencil_build_records(
+    name: Optional[str] = None, cache: Optional[str] = None, sort: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Query ``STENCIL_BUILD_RECORDS``, optionally filtering by stencil name and cache status
+    ('disk' or 'none'), and sorting by decreasing total time. Stencils found in memory are not
+    recorded, but counted by ``get_compiled_stencils_stats``.
+
+    Each record stores the wall time in seconds spent looking up the stencil in the in-memory and
+    on-disk caches ('lookup_time'), loading the stencil from the on-disk cache
+    ('cache_load_time'), calling ``gtscript.stencil`` ('stencil_call_time'), and overall
+    ('total_time'). The latter includes the phases timed by GT4Py: parsing ('parse_time'),
+    generating the stencil module ('module_time') and the backend code ('codegen_time'),
+    compiling the code ('build_time'), and loading the module ('load_time'). Phases skipped by
+    GT4Py, e.g. thanks to its own build cache, take zero time.
+    """
+    with _COMPILED_STENCILS_LOCK:
+        out = [
+            record.copy()
+            for record in STENCIL_BUILD_RECORDS
+            if (name is None or record["name"] == name)
+            and (cache is None or record["cache"] == cache)
+        ]
+    if sort:
+        out.sort(key=lambda record: record["total_time"], reverse=True)
+    return out
+
+
+def clear_stencil_build_records() -> None:
+    with _COMPILED_STENCILS_LOCK:
+        STENCIL_BUILD_RECORDS.clear()
+
+
+def _compile_stencil(
+    name: str,
+    gt4py_config: GT4PyConfig,
+    externals: Optional[Dict[str, Any]] = None,
+) -> StencilObject:
+    start = time.perf_counter()
+    key = _get_memo_key(name, gt4py_config, externals)
+    with _COMPILED_STENCILS_LOCK:
+        stencil_object = None if gt4py_config.rebuild else COMPILED_STENCILS.get(key, None)
+        if stencil_object is not None:
+            COMPILED_STENCILS_STATS["hits"] += 1
+            return stencil_object
+        COMPILED_STENCILS_STATS["misses"] += 1
+
+    record: Dict[str, Any] = {
+        "name": name,
+        "backend": gt4py_config.backend,
+        "cache": "none",
+        "lookup_time": 0.0,
+        "cache_load_time": 0.0,
+        "stencil_call_time": 0.0,
+        **{phase: 0.0 for phase in GT4PY_BUILD_PHASES},
+    }
+    record["lookup_time"] = time.perf_counter() - start
+
+    stencil_object = _load_or_build_stencil(name, gt4py_config, externals, record)
+    record["total_time"] = time.perf_counter() - start
+    with _COMPILED_STENCILS_LOCK:
+        COMPILED_STENCILS[key] = stencil_object
+        STENCIL_BUILD_RECORDS.append(record)
+    return stencil_object
+
+
+def _load_or_build_stencil(
+    name: str,
+    gt4py_config: GT4PyConfig,
+    externals: Optional[Dict[str, Any]] = None,
+    record: Optional[Dict[str, Any]] = None,
+) -> StencilObject:
+    record = record if record is not None else {}
+    record["cache"] = "none"
+    if gt4py_config.stencil_cache_dir is None:
+        return _build_stencil(name, gt4py_config, externals, record=record)
+
+    start = time.perf_counter()
+    cache = StencilCache(gt4py_config.stencil_cache_dir, gt4py_config.stencil_cache_max_size)
+    key = get_stencil_key(name, gt4py_config, externals)
+    record["lookup_time"] = record.get("lookup_time", 0.0) + time.perf_counter() - start
+    if not gt4py_config.rebuild:
+        start = time.perf_counter()
+        stencil_object = cache.load(key)
+        if stencil_object is not None:
+            record["cache"] = "disk"
+            record["cache_load_time"] = time.perf_counter() - start
+            return stencil_object
+        record["lookup_time"] += time.perf_counter() - start
+    stencil_object = _build_stencil(
+        name, gt4py_config, externals, cache_settings=cache.get_cache_settings(key), record=record
+    )
+    cache.store(key, stencil_object)
+    return stencil_object
+
+
+def _build_stencil(
+    name: str,
+    gt4py_config: GT4PyConfig,
+    externals: Optional[Dict[str, Any]] = None,
+    cache_settings: Optional[Dict[str, Any]] = None,
+    record: Optional[Dict[str, Any]] = None,
+) -> StencilObject:
+    definition = STENCIL_COLLECTION[name]["definition"]
 
     dtypes = gt4py_config.dtypes.dict()
     dtypes[float] = gt4py_config.dtypes.float  # type: ignore[index]
@@ -75,14 +532,27 @@ def compile_stencil(
     kwargs = gt4py_config.backend_opts.copy()
     if gt4py_config.backend not in ("debug", "numpy", "gtc:numpy"):
         kwargs["verbose"] = gt4py_config.verbose
+    if cache_settings is not None:
+        kwargs["cache_settings"] = {**kwargs.get("cache_settings", {}), **cache_settings}
 
-    return gtscript.stencil(  # type: ignore[no-any-return]
-        gt4py_config.backend,
-        definition,
-        name=name,
-        build_info=gt4py_config.build_info,
-        dtypes=dtypes,
-        externals=externals,
-        rebuild=gt4py_config.rebuild,
-        **kwargs,
-    )
+    build_info: Dict[str, Any] = {}
+    with _BUILD_LOCK:
+        start = time.perf_counter()
+        stencil_object = gtscript.stencil(
+            gt4py_config.backend,
+            definition,
+            name=name,
+            build_info=build_info,
+            dtypes=dtypes,
+            externals=externals,
+            rebuild=gt4py_config.rebuild,
+            **kwargs,
+        )
+    if record is not None:
+        record["stencil_call_time"] = time.perf_counter() - start
+        for phase in GT4PY_BUILD_PHASES:
+            record[phase] = float(build_info.get(phase, 0.0))
+    if gt4py_config.build_info is not None:
+        gt4py_config.build_info.update(build_info)
+
+    return stencil_object  # type: ignore[no-any-return]
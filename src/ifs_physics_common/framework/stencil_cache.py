@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2022-2024 ETH Zurich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+import importlib.util
+import json
+import os
+import shutil
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, List, Optional, Tuple
+
+    from gt4py.cartesian import StencilObject
+
+
+METADATA_FILE_NAME = "metadata.json"
+
+
+class StencilCache:
+    """
+    Content-addressed on-disk cache of GT4Py stencils.
+
+    Each entry is a sub-directory of ``root_dir`` named after the key of the stencil, which hosts
+    the GT4Py build cache of that stencil alone plus a small metadata file pointing to the
+    generated stencil module. Loading an entry imports the stencil module straight away, so that
+    no parsing or code generation takes place. The least recently used entries are evicted
+    whenever the total size of the cache exceeds ``max_size`` bytes.
+    """
+
+    def __init__(self, root_dir: str, max_size: Optional[int] = None) -> None:
+        self.root_dir = os.path.abspath(root_dir)
+        self.max_size = max_size
+
+    def get_entry_dir(self, key: str) -> str:
+        return os.path.join(self.root_dir, key)
+
+    def get_cache_settings(self, key: str) -> Dict[str, Any]:
+        """Cache settings instructing GT4Py to build the stencil within the entry directory."""
+        return {"root_path": self.get_entry_dir(key), "dir_name": ".gt_cache"}
+
+    def load(self, key: str) -> Optional[StencilObject]:
+        """Load the stencil stored under ``key``, or return ``None`` on cache miss."""
+        entry_dir = self.get_entry_dir(key)
+        metadata_file = os.path.join(entry_dir, METADATA_FILE_NAME)
+        try:
+            with open(metadata_file, "r") as f:
+                metadata = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            module_file = os.path.join(entry_dir, metadata["module_file"])
+            spec = importlib.util.spec_from_file_location(metadata["module_name"], module_file)
+            if spec is None or spec.loader is None:
+                return None
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            stencil_class = getattr(module, metadata["class_name"], None)
+        except Exception:
+            # malformed metadata, or truncated or incompatible module: treat as a cache miss
+            return None
+        if stencil_class is None:
+            return None
+
+        # mark the entry as recently used
+        os.utime(metadata_file)
+
+        return stencil_class()  # type: ignore[no-any-return]
+
+    def store(self, key: str, stencil_object: StencilObject) -> None:
+        """Register the stencil built under the entry directory of ``key``."""
+        entry_dir = self.get_entry_dir(key)
+        class_name = type(stencil_object).__name__
+        module_file = self._find_module_file(entry_dir, class_name)
+        if module_file is None:
+            return
+
+        metadata = {
+            "class_name": class_name,
+            "module_file": os.path.relpath(module_file, entry_dir),
+            "module_name": type(stencil_object).__module__,
+        }
+        metadata_file = os.path.join(entry_dir, METADATA_FILE_NAME)
+        tmp_file = f"{metadata_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(metadata, f)
+        os.replace(tmp_file, metadata_file)
+
+        self.evict(keep=key)
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """Remove the least recently used entries until the cache fits within ``max_size``."""
+        if self.max_size is None:
+            return
+
+        entries = self._get_entries()
+        total_size = sum(size for _, _, size in entries)
+        for key, _, size in sorted(entries, key=lambda entry: entry[1]):
+            if total_size <= self.max_size:
+                break
+            if key == keep:
+                continue
+            shutil.rmtree(self.get_entry_dir(key), ignore_errors=True)
+            total_size -= size
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for key, _, _ in self._get_entries():
+            shutil.rmtree(self.get_entry_dir(key), ignore_errors=True)
+
+    def _get_entries(self) -> List[Tuple[str, float, int]]:
+        """Return key, last access time and size in bytes of all complete entries."""
+        if not os.path.isdir(self.root_dir):
+            return []
+
+        out = []
+        for key in os.listdir(self.root_dir):
+            entry_dir = self.get_entry_dir(key)
+            try:
+                last_access = os.path.getmtime(os.path.join(entry_dir, METADATA_FILE_NAME))
+            except OSError:
+                # entry being built, or not a cache entry at all
+                continue
+            size = 0
+            for dir_path, _, file_names in os.walk(entry_dir):
+                for file_name in file_names:
+                    try:
+                        size += os.path.getsize(os.path.join(dir_path, file_name))
+                    except OSError:
+                        pass
+            out.append((key, last_access, size))
+        return out
+
+    @staticmethod
+    def _find_module_file(entry_dir: str, class_name: str) -> Optional[str]:
+        """Locate the Python module defining the stencil class ``class_name``."""
+        pattern = f"class {class_name}("
+        for dir_path, _, file_names in os.walk(entry_dir):
+            for file_name in file_names:
+                if not file_name.endswith(".py"):
+                    continue
+                file_path = os.path.join(dir_path, file_name)
+                with open(file_path, "r") as f:
+                    if pattern in f.read():
+                        return file_path
+        return None
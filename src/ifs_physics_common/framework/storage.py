@@ -15,22 +15,40 @@
 # limitations under the License.
 
 from __future__ import annotations
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from functools import lru_cache
+from multiprocessing.shared_memory import SharedMemory
 import numpy as np
-from typing import TYPE_CHECKING
+import os
+import tempfile
+import threading
+from typing import NamedTuple, TYPE_CHECKING
+import weakref
 
 import gt4py
+from gt4py.cartesian.backend import from_name
 from sympl._core.data_array import DataArray
 
+from ifs_physics_common.utils.timing import profiled
+
+try:
+    import cupy as cp
+except ImportError:
+    cp = np
+
 if TYPE_CHECKING:
     from collections.abc import Hashable, Iterator
-    from typing import Dict, List, Literal, Optional, Tuple
+    from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
 
+    from ifs_physics_common.framework.components import ComputationalGridComponent
     from ifs_physics_common.framework.config import GT4PyConfig
     from ifs_physics_common.framework.grid import ComputationalGrid, DimSymbol
-    from ifs_physics_common.utils.typingx import NDArrayLike
+    from ifs_physics_common.utils.typingx import NDArrayLike, PropertyDict
 
 
+@profiled("storage.zeros")
 def zeros(
     computational_grid: ComputationalGrid,
     grid_id: Hashable,
@@ -38,20 +56,334 @@ def zeros(
     *,
     gt4py_config: GT4PyConfig,
     dtype: Literal["bool", "float", "int"],
+    shared_memory: bool = False,
 ) -> NDArrayLike:
     """
     Create an array defined over the grid ``grid_id`` of ``computational_grid``
     and fill it with zeros.
 
     Relying on GT4Py utilities to optimally allocate memory based on the chosen backend.
+
+    If ``shared_memory`` is ``True``, the array is allocated in shared memory (see
+    ``shared_memory_zeros``). Otherwise, if ``gt4py_config.scratch_dir`` is set, the array is
+    backed by a file in that directory (see ``memmap_zeros``). Otherwise, if
+    ``gt4py_config.first_touch`` is ``True``, ``gt4py_config.num_threads`` threads zero-fill the
+    array in parallel (see ``first_touch``), so that on NUMA systems memory pages are placed close
+    to the threads which will process them.
     """
     grid = computational_grid.grids[grid_id]
     data_shape = data_shape or ()
     shape = grid.storage_shape + data_shape
     dtype = gt4py_config.dtypes.dict()[dtype]
+    if shared_memory:
+        return shared_memory_zeros(shape, dtype, backend=gt4py_config.backend)
+    if gt4py_config.scratch_dir is not None:
+        return memmap_zeros(
+            shape, dtype, backend=gt4py_config.backend, scratch_dir=gt4py_config.scratch_dir
+        )
+    if (
+        gt4py_config.first_touch
+        and gt4py_config.num_threads > 1
+        and get_storage_info(gt4py_config.backend)["device"] == "cpu"
+    ):
+        out = gt4py.storage.empty(shape, dtype, backend=gt4py_config.backend)
+        first_touch(out, gt4py_config.num_threads)
+        return out
     return gt4py.storage.zeros(shape, dtype, backend=gt4py_config.backend)
 
 
+def memmap_zeros(
+    shape: Tuple[int, ...], dtype: Any, *, backend: str, scratch_dir: str
+) -> np.ndarray:
+    """
+    Create a zero-filled array backed by a temporary file in ``scratch_dir``, and laid out as
+    the CPU backend ``backend`` expects.
+
+    The file is unlinked straight away, so that disk space is reclaimed as soon as the array is
+    garbage collected. Pages are loaded and written back by the OS on demand, which allows to
+    allocate more memory than physically available.
+    """
+    if get_storage_info(backend)["device"] != "cpu":
+        raise ValueError(f"File-backed storages are not supported by the backend `{backend}`.")
+
+    strides, num_bytes = get_storage_layout(shape, dtype, backend)
+    os.makedirs(scratch_dir, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=scratch_dir, prefix="storage_", suffix=".bin") as f:
+        buffer = np.memmap(f, dtype=np.uint8, mode="w+", shape=(max(num_bytes, 1),))
+    return get_buffer_view(buffer, 0, shape, dtype, strides)  # type: ignore[return-value]
+
+
+SHARED_MEMORY_BLOCKS: Dict[str, SharedMemory] = {}
+ATTACHED_SHARED_MEMORY_BLOCKS: Dict[str, SharedMemory] = {}
+
+
+class SharedStorageInfo(NamedTuple):
+    """Information needed by other processes to attach to a storage in shared memory."""
+
+    name: str
+    offset: int
+    shape: Tuple[int, ...]
+    dtype: str
+    strides: Tuple[int, ...]
+
+
+def shared_memory_zeros(shape: Tuple[int, ...], dtype: Any, *, backend: str) -> np.ndarray:
+    """
+    Create a zero-filled array in a new block of shared memory, laid out as the CPU backend
+    ``backend`` expects.
+
+    The block is owned by the current process and registered in ``SHARED_MEMORY_BLOCKS``
+    until ``release_shared_memory`` is called. Other processes can attach to the array, or to a
+    slice of it, through ``get_shared_storage_info`` and ``attach_shared_storage``.
+    """
+    if get_storage_info(backend)["device"] != "cpu":
+        raise ValueError(f"Shared-memory storages are not supported by the backend `{backend}`.")
+
+    strides, num_bytes = get_storage_layout(shape, dtype, backend)
+    block = SharedMemory(create=True, size=max(num_bytes, 1))
+    SHARED_MEMORY_BLOCKS[block.name] = block
+    buffer = np.ndarray((block.size,), dtype=np.uint8, buffer=block.buf)
+    buffer[...] = 0
+    return get_buffer_view(buffer, 0, shape, dtype, strides)  # type: ignore[return-value]
+
+
+def get_shared_storage_info(storage: np.ndarray) -> SharedStorageInfo:
+    """Describe ``storage``, which must be a view of a block of ``SHARED_MEMORY_BLOCKS``."""
+    address = storage.__array_interface__["data"][0]
+    for name, block in SHARED_MEMORY_BLOCKS.items():
+        block_address = np.frombuffer(block.buf, dtype=np.uint8).ctypes.data
+        if block_address <= address < block_address + block.size:
+            return SharedStorageInfo(
+                name, address - block_address, storage.shape, storage.dtype.str, storage.strides
+            )
+    raise ValueError("The storage does not live in shared memory.")
+
+
+def attach_shared_storage(
+    info: SharedStorageInfo, column_slice: Optional[slice] = None
+) -> np.ndarray:
+    """
+    Create a view of the storage described by ``info``, possibly restricted to the columns
+    ``column_slice`` along the first dimension, without copying any data.
+    """
+    block = SHARED_MEMORY_BLOCKS.get(info.name, None) or ATTACHED_SHARED_MEMORY_BLOCKS.get(
+        info.name, None
+    )
+    if block is None:
+        block = ATTACHED_SHARED_MEMORY_BLOCKS[info.name] = SharedMemory(name=info.name)
+    out = np.ndarray(
+        info.shape, dtype=info.dtype, buffer=block.buf, offset=info.offset, strides=info.strides
+    )
+    if column_slice is not None:
+        out = out[column_slice]
+    return out
+
+
+def release_shared_memory() -> None:
+    """
+    Detach from all blocks of shared memory, and destroy the blocks owned by the current process.
+    Arrays viewing the blocks must not be used afterwards.
+    """
+    for block in ATTACHED_SHARED_MEMORY_BLOCKS.values():
+        try:
+            block.close()
+        except BufferError:
+            # views of the block still exist: the mapping is released along with them
+            pass
+    ATTACHED_SHARED_MEMORY_BLOCKS.clear()
+    for block in SHARED_MEMORY_BLOCKS.values():
+        try:
+            block.close()
+        except BufferError:
+            pass
+        block.unlink()
+    SHARED_MEMORY_BLOCKS.clear()
+
+
+# arrays smaller than this are zero-filled by the calling thread alone
+FIRST_TOUCH_MIN_BYTES = 1 << 20
+FIRST_TOUCH_EXECUTORS: Dict[int, ThreadPoolExecutor] = {}
+_FIRST_TOUCH_LOCK = threading.Lock()
+
+
+def first_touch(storage: NDArrayLike, num_threads: int) -> None:
+    """
+    Zero-fill ``storage`` using ``num_threads`` threads.
+
+    The first dimension is split into contiguous blocks of (nearly) equal size, one per thread,
+    mimicking the static schedule of the OpenMP loop over the columns. This places the memory
+    pages only if the first dimension is the outermost in memory; otherwise, as well as for
+    arrays smaller than ``FIRST_TOUCH_MIN_BYTES``, the calling thread zero-fills the array alone.
+    The threads are drawn from a pool shared by all calls.
+    """
+    size = storage.shape[0] if storage.ndim > 0 else 0
+    num_threads = min(num_threads, size)
+    if (
+        num_threads <= 1
+        or storage.nbytes < FIRST_TOUCH_MIN_BYTES
+        or storage.strides[0] < max(storage.strides)
+    ):
+        storage[...] = 0
+        return
+
+    chunk_size = -(-size // num_threads)
+
+    def core(thread_id: int) -> None:
+        storage[thread_id * chunk_size : (thread_id + 1) * chunk_size] = 0
+
+    with _FIRST_TOUCH_LOCK:
+        executor = FIRST_TOUCH_EXECUTORS.get(num_threads)
+        if executor is None:
+            executor = FIRST_TOUCH_EXECUTORS[num_threads] = ThreadPoolExecutor(
+                max_workers=num_threads, thread_name_prefix="first_touch"
+            )
+    list(executor.map(core, range(num_threads)))
+
+
+@profiled("storage.empty")
+def empty(
+    computational_grid: ComputationalGrid,
+    grid_id: Hashable,
+    data_shape: Optional[Tuple[int, ...]] = None,
+    *,
+    gt4py_config: GT4PyConfig,
+    dtype: Literal["bool", "float", "int"],
+) -> NDArrayLike:
+    """
+    Create an array defined over the grid ``grid_id`` of ``computational_grid``
+    without initializing it.
+
+    If ``gt4py_config.scratch_dir`` is set, the array is backed by a file in that directory
+    (see ``memmap_zeros``). If ``gt4py_config.poison_empty_storages`` is ``True``, the array is
+    filled with NaNs (see ``poison``) to expose read-before-write errors.
+    """
+    grid = computational_grid.grids[grid_id]
+    data_shape = data_shape or ()
+    shape = grid.storage_shape + data_shape
+    dtype = gt4py_config.dtypes.dict()[dtype]
+    if gt4py_config.scratch_dir is not None:
+        out = memmap_zeros(
+            shape, dtype, backend=gt4py_config.backend, scratch_dir=gt4py_config.scratch_dir
+        )
+    else:
+        out = gt4py.storage.empty(shape, dtype, backend=gt4py_config.backend)
+    if gt4py_config.poison_empty_storages:
+        poison(out)
+    return out
+
+
+def poison(storage: NDArrayLike) -> None:
+    """
+    Fill ``storage`` with NaNs if it is a float array, or with the smallest representable
+    value if it is an integer array. Boolean arrays are left untouched.
+    """
+    kind = storage.dtype.kind
+    if kind == "f":
+        storage[...] = np.nan
+    elif kind in ("i", "u"):
+        storage[...] = np.iinfo(storage.dtype).min
+
+
+@lru_cache(maxsize=None)
+def get_storage_info(backend: str) -> Dict[str, Any]:
+    """Retrieve alignment, device and layout of the storages allocated by ``backend``."""
+    return from_name(backend).storage_info  # type: ignore[no-any-return]
+
+
+def get_default_dimensions(ndim: int) -> Tuple[str, ...]:
+    """Dimensions assumed by GT4Py for a storage with ``ndim`` dimensions."""
+    return ("I", "J", "K")[:ndim] + tuple(str(d) for d in range(ndim - 3))
+
+
+def get_storage_signature(
+    computational_grid: ComputationalGrid,
+    grid_id: Hashable,
+    data_shape: Optional[Tuple[int, ...]] = None,
+    *,
+    gt4py_config: GT4PyConfig,
+    dtype: Literal["bool", "float", "int"],
+) -> Tuple[Hashable, ...]:
+    """
+    Signature of the storage allocated by ``zeros``: backend, concrete datatype, shape, alignment
+    and layout. Storages with the same signature are interchangeable.
+    """
+    grid = computational_grid.grids[grid_id]
+    data_shape = data_shape or ()
+    shape = grid.storage_shape + data_shape
+    storage_info = get_storage_info(gt4py_config.backend)
+    layout_map = storage_info["layout_map"](get_default_dimensions(len(shape)))
+    return (
+        gt4py_config.backend,
+        np.dtype(gt4py_config.dtypes.dict()[dtype]).str,
+        shape,
+        storage_info["alignment"],
+        tuple(layout_map),
+    )
+
+
+def get_storage_layout(
+    shape: Tuple[int, ...], dtype: Any, backend: str
+) -> Tuple[Tuple[int, ...], int]:
+    """
+    Compute the strides and the number of bytes of a storage of shape ``shape`` and datatype
+    ``dtype`` laid out as ``backend`` expects.
+
+    The strides follow the layout map of the backend, and the innermost dimension is padded to a
+    multiple of the alignment of the backend, as GT4Py does.
+    """
+    storage_info = get_storage_info(backend)
+    ndim = len(shape)
+    layout_map = storage_info["layout_map"](get_default_dimensions(ndim))
+    itemsize = np.dtype(dtype).itemsize
+    # GT4Py measures the alignment in elements
+    items_per_alignment = max(storage_info["alignment"], 1)
+
+    # from innermost to outermost dimension
+    order = sorted(
+        range(ndim), key=lambda d: layout_map[d] if layout_map[d] is not None else -1, reverse=True
+    )
+    strides = [0] * ndim
+    stride = itemsize
+    for i, d in enumerate(order):
+        strides[d] = stride
+        extent = shape[d]
+        if i == 0:
+            extent = -(-extent // items_per_alignment) * items_per_alignment
+        stride *= extent
+    return tuple(strides), stride
+
+
+def get_storage_alignment(dtype: Any, backend: str) -> int:
+    """Alignment in bytes of the storages of datatype ``dtype`` allocated by ``backend``."""
+    alignment = max(get_storage_info(backend)["alignment"], 1)
+    return alignment * np.dtype(dtype).itemsize  # type: ignore[no-any-return]
+
+
+def get_buffer_view(
+    buffer: NDArrayLike,
+    offset: int,
+    shape: Tuple[int, ...],
+    dtype: Any,
+    strides: Tuple[int, ...],
+) -> NDArrayLike:
+    """Create an array of shape ``shape`` and datatype ``dtype`` viewing the bytes of ``buffer``."""
+    if cp is not np and isinstance(buffer, cp.ndarray):
+        return cp.ndarray(shape, dtype=dtype, memptr=buffer.data + offset, strides=strides)
+    else:
+        return np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset, strides=strides)
+
+
+DATA_ARRAY_CACHE: weakref.WeakValueDictionary[Hashable, DataArray] = weakref.WeakValueDictionary()
+
+
+@lru_cache(maxsize=None)
+def get_data_coord(size: int) -> np.ndarray:
+    """Read-only coordinate array of a data dimension of size ``size``."""
+    out = np.arange(size)
+    out.flags.writeable = False
+    return out
+
+
 def get_data_array(
     buffer: NDArrayLike,
     computational_grid: ComputationalGrid,
@@ -59,14 +391,39 @@ def get_data_array(
     units: str,
     data_dims: Optional[Tuple[str, ...]] = None,
 ) -> DataArray:
-    """Create a ``DataArray`` out of ``buffer``."""
-    grid = computational_grid.grids[grid_id]
+    """
+    Create a ``DataArray`` out of ``buffer``.
+
+    The ``DataArray`` is cached as long as it is referenced elsewhere, and returned again by any
+    subsequent call with the same arguments. Coordinate arrays are shared among all wrappers.
+    """
     data_dims = data_dims or ()
+    key = (id(buffer), id(computational_grid), grid_id, units, data_dims)
+    out = DATA_ARRAY_CACHE.get(key, None)
+    if out is not None and out.data is buffer:
+        return out
+
+    grid = computational_grid.grids[grid_id]
     dims = grid.dims + data_dims
     coords = grid.coords + tuple(
-        np.arange(data_size) for data_size in buffer.shape[len(grid.dims) :]
+        get_data_coord(data_size) for data_size in buffer.shape[len(grid.dims) :]
     )
-    return DataArray(buffer, dims=dims, coords=coords, attrs={"units": units})
+    out = DataArray(buffer, dims=dims, coords=coords, attrs={"units": units})
+    try:
+        DATA_ARRAY_CACHE[key] = out
+    except TypeError:
+        # the class does not support weak references
+        pass
+    return out
+
+
+def rewrap_data_array(data_array: DataArray, buffer: NDArrayLike) -> DataArray:
+    """
+    Create a ``DataArray`` out of ``buffer`` with the same dimensions, coordinates and attributes
+    of ``data_array``, skipping any validation. ``buffer`` must have the same shape of
+    ``data_array``.
+    """
+    return data_array.copy(deep=False, data=buffer)
 
 
 def allocate_data_array(
@@ -78,17 +435,42 @@ def allocate_data_array(
     *,
     gt4py_config: GT4PyConfig,
     dtype: Literal["bool", "float", "int"],
+    shared_memory: bool = False,
 ) -> DataArray:
     """
     Create a ``DataArray`` defined over the grid ``grid_id`` of ``computational_grid``
     and fill it with zeros.
+
+    If ``shared_memory`` is ``True``, the underlying buffer is allocated in shared memory.
     """
     buffer = zeros(
-        computational_grid, grid_id, data_shape=data_shape, gt4py_config=gt4py_config, dtype=dtype
+        computational_grid,
+        grid_id,
+        data_shape=data_shape,
+        gt4py_config=gt4py_config,
+        dtype=dtype,
+        shared_memory=shared_memory,
     )
     return get_data_array(buffer, computational_grid, grid_id, units, data_dims=data_dims)
 
 
+def attach_shared_data_array(
+    info: SharedStorageInfo,
+    computational_grid: ComputationalGrid,
+    grid_id: Tuple[DimSymbol, ...],
+    units: str,
+    data_dims: Optional[Tuple[str, ...]] = None,
+    column_slice: Optional[slice] = None,
+) -> DataArray:
+    """
+    Wrap the storage in shared memory described by ``info`` into a ``DataArray`` without copying.
+
+    If ``column_slice`` is given, ``computational_grid`` must describe the selected columns only.
+    """
+    buffer = attach_shared_storage(info, column_slice=column_slice)
+    return get_data_array(buffer, computational_grid, grid_id, units, data_dims=data_dims)
+
+
 def get_dtype_from_name(field_name: str) -> Literal["bool", "float", "int"]:
     """
     Retrieve the datatype of a field from its name.
@@ -118,7 +500,281 @@ def get_data_shape_from_name(field_name: str) -> Tuple[int, ...]:
     return out
 
 
-TEMPORARY_STORAGE_POOL: Dict[int, List[NDArrayLike]] = {}
+class StorageArena:
+    """
+    Single slab of memory hosting multiple storages.
+
+    ``groups`` maps the name of each group of fields (e.g. 'state' or 'tendencies') to a
+    dictionary of properties, as returned by ``input_properties``, ``diagnostic_properties``
+    and ``tendency_properties`` of the components. The datatype and the data shape of each field
+    are retrieved from its name. Each storage is a view of the slab, with the strides and the
+    alignment that the backend would use. The whole slab can be saved and restored at once.
+    """
+
+    def __init__(
+        self,
+        computational_grid: ComputationalGrid,
+        groups: Dict[str, PropertyDict],
+        *,
+        gt4py_config: GT4PyConfig,
+    ) -> None:
+        self.computational_grid = computational_grid
+        self.gt4py_config = gt4py_config
+
+        storage_info = get_storage_info(gt4py_config.backend)
+
+        # carve out the slab
+        layouts = []
+        num_bytes = 0
+        alignment = 64
+        for group_name, properties in groups.items():
+            for field_name, field_prop in properties.items():
+                grid = computational_grid.grids[field_prop["grid"]]
+                shape = grid.storage_shape + get_data_shape_from_name(field_name)
+                dtype = gt4py_config.dtypes.dict()[get_dtype_from_name(field_name)]
+                strides, field_num_bytes = get_storage_layout(shape, dtype, gt4py_config.backend)
+                field_alignment = max(get_storage_alignment(dtype, gt4py_config.backend), 64)
+                alignment = max(alignment, field_alignment)
+                num_bytes = -(-num_bytes // field_alignment) * field_alignment
+                layouts.append((group_name, field_name, num_bytes, shape, dtype, strides))
+                num_bytes += field_num_bytes
+
+        # allocate the slab, and align its start
+        xp = cp if storage_info["device"] == "gpu" else np
+        buffer = xp.zeros(num_bytes + alignment, dtype=np.uint8)
+        address = buffer.data.ptr if xp is not np else buffer.ctypes.data
+        start = -address % alignment
+        self.slab = buffer[start : start + num_bytes]
+
+        self.storages: Dict[str, Dict[str, NDArrayLike]] = {
+            group_name: {} for group_name in groups
+        }
+        for group_name, field_name, offset, shape, dtype, strides in layouts:
+            self.storages[group_name][field_name] = get_buffer_view(
+                self.slab, offset, shape, dtype, strides
+            )
+
+    @classmethod
+    def from_components(
+        cls,
+        computational_grid: ComputationalGrid,
+        components: Sequence[ComputationalGridComponent],
+        *,
+        gt4py_config: GT4PyConfig,
+    ) -> StorageArena:
+        """
+        Create an arena with the group 'state', collecting the input and diagnostic fields of all
+        ``components``, and the group 'tendencies', collecting their tendency fields.
+        """
+        state: PropertyDict = {}
+        tendencies: PropertyDict = {}
+        for component in components:
+            state.update(getattr(component, "input_properties", {}))
+            state.update(getattr(component, "diagnostic_properties", {}))
+            tendencies.update(getattr(component, "tendency_properties", {}))
+        return cls(
+            computational_grid,
+            {"state": state, "tendencies": tendencies},
+            gt4py_config=gt4py_config,
+        )
+
+    @property
+    def num_bytes(self) -> int:
+        return self.slab.nbytes  # type: ignore[no-any-return]
+
+    def snapshot(self) -> NDArrayLike:
+        """Copy the content of all storages in a single sweep."""
+        return self.slab.copy()
+
+    def restore(self, snapshot: NDArrayLike) -> None:
+        """Restore the content of all storages from ``snapshot`` in a single sweep."""
+        self.slab[...] = snapshot
+
+
+class _FreeLists:
+    """Free lists of storages grouped by key, in least recently used order of the keys."""
+
+    __slots__ = ("storages", "num_bytes", "__weakref__")
+
+    def __init__(self) -> None:
+        self.storages: OrderedDict[Hashable, List[NDArrayLike]] = OrderedDict()
+        self.num_bytes = 0
+
+    def pop(self, key: Hashable) -> Optional[NDArrayLike]:
+        storages = self.storages.get(key, None)
+        if storages is None:
+            return None
+        self.storages.move_to_end(key)
+        if len(storages) == 0:
+            return None
+        storage = storages.pop()
+        self.num_bytes -= storage.nbytes
+        return storage
+
+    def push(self, key: Hashable, storage: NDArrayLike) -> None:
+        self.storages.setdefault(key, []).append(storage)
+        self.storages.move_to_end(key)
+        self.num_bytes += storage.nbytes
+
+    def pop_lru(self) -> Optional[Tuple[Hashable, NDArrayLike]]:
+        for key, storages in self.storages.items():
+            if len(storages) > 0:
+                storage = storages.pop(0)
+                self.num_bytes -= storage.nbytes
+                if len(storages) == 0:
+                    del self.storages[key]
+                return key, storage
+        return None
+
+    def __len__(self) -> int:
+        return sum(len(storages) for storages in self.storages.values())
+
+
+class TemporaryStoragePool:
+    """
+    Thread-safe pool of temporary storages, grouped by key.
+
+    Each thread draws from and returns to its own free lists without any locking, so that reuse
+    is deterministic within a thread. The free lists of a thread hold at most ``max_local_bytes``
+    bytes: whenever this is exceeded, the storages associated with the least recently used keys
+    are moved to a shared overflow, which is protected by a lock and is accessible to all
+    threads. The free lists of terminated threads are moved to the shared overflow too.
+
+    Overall, the pool holds at most ``max_bytes`` bytes, summed over the free lists of all threads
+    and the shared overflow. Whenever a storage given back to the pool exceeds the budget, the
+    least recently used storages are evicted from the shared overflow first, and then from the
+    free lists of the calling thread. Storages handed out to callers do not count towards any
+    budget. The total is tracked as storages come and go, without locking, so that the lock is
+    only taken when the budget is exceeded; the exact total is then recomputed.
+    """
+
+    def __init__(
+        self, max_bytes: Optional[int] = None, max_local_bytes: Optional[int] = None
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.max_local_bytes = max_local_bytes
+        self._local = threading.local()
+        self._shared = _FreeLists()
+        self._lock = threading.Lock()
+        self._all_local_free_lists: weakref.WeakSet[_FreeLists] = weakref.WeakSet()
+        # running total of pooled bytes, resynchronized whenever the lock is taken
+        self._num_bytes = 0
+
+    @property
+    def local_free_lists(self) -> _FreeLists:
+        """Free lists of the calling thread."""
+        try:
+            return self._local.free_lists  # type: ignore[no-any-return]
+        except AttributeError:
+            free_lists = self._local.free_lists = _FreeLists()
+            with self._lock:
+                self._all_local_free_lists.add(free_lists)
+            weakref.finalize(free_lists, self._adopt, free_lists.storages)
+            return free_lists
+
+    @property
+    def num_bytes(self) -> int:
+        with self._lock:
+            return self._get_num_bytes()
+
+    @profiled("storage_pool.acquire")
+    def acquire(self, key: Hashable) -> Optional[NDArrayLike]:
+        """Retrieve a storage associated with ``key``, or return ``None`` if not available."""
+        storage = self.local_free_lists.pop(key)
+        if storage is None and self._shared.num_bytes > 0:
+            with self._lock:
+                storage = self._shared.pop(key)
+        if storage is not None:
+            self._num_bytes -= storage.nbytes
+        return storage
+
+    @profiled("storage_pool.release")
+    def release(self, key: Hashable, storage: NDArrayLike) -> None:
+        """Give ``storage`` back to the pool, spilling and evicting storages if over budget."""
+        free_lists = self.local_free_lists
+        free_lists.push(key, storage)
+        self._num_bytes += storage.nbytes
+        spill = self.max_local_bytes is not None and free_lists.num_bytes > self.max_local_bytes
+        if spill or (self.max_bytes is not None and self._num_bytes > self.max_bytes):
+            with self._lock:
+                if spill:
+                    while free_lists.num_bytes > self.max_local_bytes:  # type: ignore[operator]
+                        item = free_lists.pop_lru()
+                        if item is None:
+                            break
+                        self._shared.push(*item)
+                self._evict(free_lists)
+
+    @profiled("storage_pool.trim")
+    def trim(self, max_bytes: int = 0) -> int:
+        """
+        Evict storages in least recently used order, first from the shared overflow and then
+        from the free lists of the calling thread, until together they occupy at most
+        ``max_bytes`` bytes. Return the number of bytes released.
+        """
+        free_lists = self.local_free_lists
+        with self._lock:
+            num_bytes = self._shared.num_bytes + free_lists.num_bytes
+            excess = num_bytes - max_bytes
+            self._evict_lru(free_lists, excess)
+            self._num_bytes = self._get_num_bytes()
+            return num_bytes - self._shared.num_bytes - free_lists.num_bytes
+
+    def clear(self) -> None:
+        """
+        Evict all storages held by all threads. Must not be called while other threads are
+        acquiring or releasing storages.
+        """
+        with self._lock:
+            for free_lists in self._all_local_free_lists:
+                free_lists.storages.clear()
+                free_lists.num_bytes = 0
+            self._shared.storages.clear()
+            self._shared.num_bytes = 0
+            self._num_bytes = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._shared) + sum(
+                len(free_lists) for free_lists in self._all_local_free_lists
+            )
+
+    def _adopt(self, storages: Dict[Hashable, List[NDArrayLike]]) -> None:
+        """Move the free lists of a terminated thread to the shared overflow."""
+        with self._lock:
+            for key, key_storages in storages.items():
+                for storage in key_storages:
+                    self._shared.push(key, storage)
+            self._evict(None)
+
+    def _get_num_bytes(self) -> int:
+        return self._shared.num_bytes + sum(
+            free_lists.num_bytes for free_lists in self._all_local_free_lists
+        )
+
+    def _evict(self, free_lists: Optional[_FreeLists]) -> None:
+        """
+        Evict storages until the whole pool fits within ``max_bytes``, and resynchronize the
+        running total. Requires the lock.
+        """
+        if self.max_bytes is not None:
+            self._evict_lru(free_lists, self._get_num_bytes() - self.max_bytes)
+        self._num_bytes = self._get_num_bytes()
+
+    def _evict_lru(self, free_lists: Optional[_FreeLists], num_bytes: int) -> None:
+        """
+        Evict at least ``num_bytes`` bytes from the shared overflow and then from ``free_lists``,
+        which must belong to the calling thread. Requires the lock.
+        """
+        for candidates in (self._shared, free_lists):
+            while candidates is not None and num_bytes > 0:
+                item = candidates.pop_lru()
+                if item is None:
+                    break
+                num_bytes -= item[1].nbytes
+
+
+TEMPORARY_STORAGE_POOL = TemporaryStoragePool()
 
 
 @contextmanager
@@ -126,6 +782,7 @@ def managed_temporary_storage(
     computational_grid: ComputationalGrid,
     *args: Tuple[Tuple[DimSymbol, ...], Literal["bool", "float", "int"]],
     gt4py_config: GT4PyConfig,
+    write_before_read: bool = False,
 ) -> Iterator[NDArrayLike]:
     """
     Get temporary storages defined over the grids of ``computational_grid``.
@@ -133,20 +790,29 @@ def managed_temporary_storage(
     Each ``arg`` is a tuple where the first element specifies the grid identifier, and the second
     element specifies the datatype.
 
+    If ``write_before_read`` is ``True``, the caller guarantees to fully overwrite the storages
+    before reading them, so that newly created storages are not zero-filled. In this case, if
+    ``gt4py_config.poison_empty_storages`` is ``True``, both new and reused storages are filled
+    with NaNs (see ``poison``).
+
     The storages are either created on-the-fly, or retrieved from ``TEMPORARY_STORAGE_POOL``
     if available. On exit, all storages are included in ``TEMPORARY_STORAGE_POOL`` for later use.
+    Storages are pooled by their signature (see ``get_storage_signature``), so that multiple
+    configurations can safely share the pool.
     """
-    grid_hashes = []
+    signatures = []
     storages = []
     for grid_id, dtype in args:
-        grid = computational_grid.grids[grid_id]
-        grid_hash = hash((grid.shape + grid_id, dtype))
-        pool = TEMPORARY_STORAGE_POOL.setdefault(grid_hash, [])
-        if len(pool) > 0:
-            storage = pool.pop()
-        else:
-            storage = zeros(computational_grid, grid_id, gt4py_config=gt4py_config, dtype=dtype)
-        grid_hashes.append(grid_hash)
+        signature = get_storage_signature(
+            computational_grid, grid_id, gt4py_config=gt4py_config, dtype=dtype
+        )
+        storage = TEMPORARY_STORAGE_POOL.acquire(signature)
+        if storage is None:
+            allocate = empty if write_before_read else zeros
+            storage = allocate(computational_grid, grid_id, gt4py_config=gt4py_config, dtype=dtype)
+        elif write_before_read and gt4py_config.poison_empty_storages:
+            poison(storage)
+        signatures.append(signature)
         storages.append(storage)
 
     try:
@@ -155,25 +821,25 @@ def managed_temporary_storage(
         else:
             yield storages
     finally:
-        for grid_hash, storage in zip(grid_hashes, storages):
-            TEMPORARY_STORAGE_POOL[grid_hash].append(storage)
+        for signature, storage in zip(signatures, storages):
+            TEMPORARY_STORAGE_POOL.release(signature, storage)
 
 
 @contextmanager
-def managed_temporary_storage_pool() -> Iterator[None]:
+def managed_temporary_storage_pool(max_bytes: Optional[int] = None) -> Iterator[None]:
     """
     Clear the pool of temporary storages ``TEMPORARY_STORAGE_POOL`` on entry and exit.
 
-    Useful when running multiple simulations using different backends within the same session.
-    All simulations using the same backend should be wrapped by this context manager.
+    Storages allocated with different backends or datatypes are never mixed up by the pool, so
+    this context manager is only needed to release memory between simulations. If ``max_bytes``
+    is given, the pool holds at most ``max_bytes`` bytes overall within the context.
     """
+    prev_max_bytes = TEMPORARY_STORAGE_POOL.max_bytes
     try:
         TEMPORARY_STORAGE_POOL.clear()
+        if max_bytes is not None:
+            TEMPORARY_STORAGE_POOL.max_bytes = max_bytes
         yield None
     finally:
-        for grid_hash, storages in TEMPORARY_STORAGE_POOL.items():
-            num_storages = len(storages)
-            for _ in range(num_storages):
-                storage = storages.pop()
-                del storage
         TEMPORARY_STORAGE_POOL.clear()
+        TEMPORARY_STORAGE_POOL.max_bytes = prev_max_bytes
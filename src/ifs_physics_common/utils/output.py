@@ -17,11 +17,14 @@
 from __future__ import annotations
 import csv
 import datetime
+import json
 import os
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Any, Dict, Literal, Optional, Sequence, Tuple
+    from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
+
+    from ifs_physics_common.framework.communication import Communicator
 
 
 def write_performance_to_csv(
@@ -125,26 +128,117 @@ def write_stencils_performance_to_csv(
         )
 
 
+STENCIL_BUILD_TIMES = (
+    "lookup_time",
+    "cache_load_time",
+    "stencil_call_time",
+    "parse_time",
+    "module_time",
+    "codegen_time",
+    "build_time",
+    "load_time",
+    "total_time",
+)
+
+
+def write_stencils_build_times_to_csv(
+    output_file: str, host_name: str, build_records: List[Dict[str, Any]]
+) -> None:
+    """
+    Write the wall time spent in each phase of the compilation of the stencils to a CSV file.
+
+    ``build_records`` is typically obtained from ``framework.stencil.get_stencil_build_records``.
+    """
+    if not os.path.exists(output_file):
+        with open(output_file, "w") as f:
+            writer = csv.writer(f, delimiter=",")
+            writer.writerow(
+                (
+                    "date",
+                    "host",
+                    "stencil",
+                    "backend",
+                    "cache",
+                    *STENCIL_BUILD_TIMES,
+                )
+            )
+    with open(output_file, "a") as f:
+        writer = csv.writer(f, delimiter=",")
+        date = datetime.date.today().strftime("%Y%m%d")
+        for record in build_records:
+            writer.writerow(
+                (
+                    date,
+                    host_name,
+                    record["name"],
+                    record["backend"],
+                    record["cache"],
+                    *(record.get(field, 0.0) for field in STENCIL_BUILD_TIMES),
+                )
+            )
+
+
+def write_stencils_build_times_to_json(
+    output_file: str, host_name: str, build_records: List[Dict[str, Any]]
+) -> None:
+    """
+    Write the wall time spent in each phase of the compilation of the stencils to a JSON file.
+    """
+    with open(output_file, "w") as f:
+        json.dump(
+            {
+                "date": datetime.date.today().strftime("%Y%m%d"),
+                "host": host_name,
+                "stencils": build_records,
+            },
+            f,
+            indent=2,
+        )
+
+
 def print_performance(
-    num_cols: int, runtime_l: Sequence[float], mflops_l: Optional[Sequence[float]] = None
+    num_cols: int,
+    runtime_l: Sequence[float],
+    mflops_l: Optional[Sequence[float]] = None,
+    comm: Optional[Communicator] = None,
 ) -> Tuple[float, float, float, float]:
-    """Print means and standard deviation of runtimes and MFLOPS."""
+    """
+    Print means and standard deviation of runtimes and MFLOPS.
+
+    If ``comm`` is given, ``num_cols`` and ``runtime_l`` refer to the local rank: the number of
+    columns is summed over all ranks, the runtime of each run is the maximum over all ranks,
+    and only rank 0 prints.
+    """
+    if comm is not None:
+        num_cols = comm.allreduce(num_cols, lambda a, b: a + b)
+        runtime_l = comm.allreduce(
+            list(runtime_l), lambda a, b: [max(ra, rb) for ra, rb in zip(a, b)]
+        )
+        if mflops_l is not None:
+            mflops_l = comm.allreduce(
+                list(mflops_l), lambda a, b: [ma + mb for ma, mb in zip(a, b)]
+            )
+
+    verbose = comm is None or comm.rank == 0
     n = len(runtime_l)
-    print(f"== Performance:")
-    print(f"   - Number of columns: {num_cols}")
-    print(f"   - Number of runs: {n}")
+    if verbose:
+        print(f"== Performance:")
+        print(f"   - Number of columns: {num_cols}")
+        print(f"   - Number of runs: {n}")
 
     runtime_mean = sum(runtime_l) / n
     runtime_stddev = (
         sum((runtime - runtime_mean) ** 2 for runtime in runtime_l) / (n - 1 if n > 1 else n)
     ) ** 0.5
-    print(f"   - Runtime: {runtime_mean:.3f} \u00B1 {runtime_stddev:.3f} ms")
+    if verbose:
+        print(f"   - Runtime: {runtime_mean:.3f} \u00B1 {runtime_stddev:.3f} ms")
 
     mflops_l = mflops_l or [0.12482329 * num_cols / (runtime / 1000) for runtime in runtime_l]
     mflops_mean = sum(mflops_l) / n
     mflops_stddev = (
         sum((mflops - mflops_mean) ** 2 for mflops in mflops_l) / (n - 1 if n > 1 else n)
     ) ** 0.5
-    print(f"   - MFLOPS: {mflops_mean:.3f} \u00B1 {mflops_stddev:.3f}")
+    if verbose:
+        print(f"   - MFLOPS: {mflops_mean:.3f} \u00B1 {mflops_stddev:.3f}")
 
     return runtime_mean, runtime_stddev, mflops_mean, mflops_stddev
@@ -16,13 +16,18 @@
 
 from __future__ import annotations
 from contextlib import contextmanager
+from functools import wraps
+import threading
+from time import perf_counter_ns
 from typing import TYPE_CHECKING
 
 from sympl._core.time import Timer
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
-    from typing import Type
+    from collections.abc import Callable, Iterator
+    from typing import Any, Dict, List, Optional, TextIO, Tuple, Type, TypeVar
+
+    T = TypeVar("T")
 
 
 @contextmanager
@@ -32,3 +37,184 @@ def timing(label: str) -> Iterator[Type[Timer]]:
         yield Timer
     finally:
         Timer.stop()
+
+
+class ProfileNode:
+    """Node of the profiling tree, accumulating the number of calls and the time spent in ns."""
+
+    __slots__ = ("label", "num_calls", "time_ns", "children")
+
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self.num_calls = 0
+        self.time_ns = 0
+        self.children: Dict[str, ProfileNode] = {}
+
+    def get_child(self, label: str) -> ProfileNode:
+        child = self.children.get(label)
+        if child is None:
+            child = self.children[label] = ProfileNode(label)
+        return child
+
+    @property
+    def self_time_ns(self) -> int:
+        """Time spent in the node itself, excluding its children."""
+        return max(0, self.time_ns - sum(child.time_ns for child in self.children.values()))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "label": self.label,
+            "num_calls": self.num_calls,
+            "time_ns": self.time_ns,
+            "children": [child.to_dict() for child in self.children.values()],
+        }
+
+
+class Profiler:
+    """
+    Hierarchical profiler. Each thread records into its own tree, whose root is labeled after
+    the name of the thread. Threads sharing a name still get separate trees. Profiling is disabled
+    by default, in which case ``profile`` and ``profiled`` reduce to a flag check.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.roots: Dict[Tuple[int, str], ProfileNode] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def get_stack(self) -> List[ProfileNode]:
+        """Get the stack of open nodes of the calling thread."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            thread = threading.current_thread()
+            key = (threading.get_ident(), thread.name)
+            with self._lock:
+                root = self.roots.get(key)
+                if root is None:
+                    root = self.roots[key] = ProfileNode(thread.name)
+            stack = self._local.stack = [root]
+        return stack  # type: ignore[no-any-return]
+
+    def start(self, label: str) -> int:
+        stack = self.get_stack()
+        stack.append(stack[-1].get_child(label))
+        return perf_counter_ns()
+
+    def stop(self, start_ns: int) -> None:
+        elapsed_ns = perf_counter_ns() - start_ns
+        node = self.get_stack().pop()
+        node.num_calls += 1
+        node.time_ns += elapsed_ns
+
+    def add(self, label: str, time_ns: int, num_calls: int = 1) -> None:
+        """Record ``num_calls`` calls to ``label`` lasting ``time_ns`` under the current node."""
+        node = self.get_stack()[-1].get_child(label)
+        node.num_calls += num_calls
+        node.time_ns += time_ns
+
+    def reset(self) -> None:
+        """Discard all the measurements. Must not be called while any node is open."""
+        with self._lock:
+            self.roots = {}
+            self._local = threading.local()
+
+    def write_tree(self, output_file: str) -> None:
+        """Write the profiling trees as indented text, with times in milliseconds."""
+        with open(output_file, "w") as f:
+            f.write(f"{'label':60s} {'calls':>10s} {'total [ms]':>14s} {'self [ms]':>14s}\n")
+            for root in self.roots.values():
+                _write_node(f, root, 0)
+
+    def write_collapsed_stacks(self, output_file: str) -> None:
+        """
+        Write the self time in nanoseconds of each node in the collapsed-stack format read by
+        flame graph tools, e.g. ``flamegraph.pl`` or speedscope.
+        """
+        with open(output_file, "w") as f:
+            for root in self.roots.values():
+                for path, node in _iter_nodes(root, ()):
+                    if node.self_time_ns > 0:
+                        f.write(f"{';'.join(path)} {node.self_time_ns}\n")
+
+
+def _write_node(f: TextIO, node: ProfileNode, depth: int) -> None:
+    label = "  " * depth + node.label
+    f.write(
+        f"{label:60s} {node.num_calls:10d} {node.time_ns / 1e6:14.3f} "
+        f"{node.self_time_ns / 1e6:14.3f}\n"
+    )
+    for child in node.children.values():
+        _write_node(f, child, depth + 1)
+
+
+def _iter_nodes(
+    node: ProfileNode, path: Tuple[str, ...]
+) -> Iterator[Tuple[Tuple[str, ...], ProfileNode]]:
+    path = path + (node.label.replace(";", ":").replace(" ", "_"),)
+    yield path, node
+    for child in node.children.values():
+        yield from _iter_nodes(child, path)
+
+
+PROFILER = Profiler()
+
+
+def enable_profiling(enabled: bool = True) -> None:
+    PROFILER.enabled = enabled
+
+
+def _get_exec_info_totals(exec_info: Dict[str, Any]) -> Dict[str, Tuple[float, Optional[int]]]:
+    return {
+        key: (value["total_call_time"], value.get("ncalls", value.get("call_count")))
+        for key, value in exec_info.items()
+        if isinstance(value, dict) and "total_call_time" in value
+    }
+
+
+@contextmanager
+def profile(label: str, exec_info: Optional[Dict[str, Any]] = None) -> Iterator[None]:
+    """
+    Profile the enclosed code as a node ``label`` of the tree of the calling thread.
+
+    If ``exec_info`` is the aggregated execution info passed to GT4Py stencils, the stencil calls
+    issued within the context are recorded as children of ``label``. These are only accurate if
+    no other thread calls stencils with the same ``exec_info`` in the meantime.
+    """
+    if not PROFILER.enabled:
+        yield
+        return
+
+    totals = _get_exec_info_totals(exec_info) if exec_info is not None else None
+    start_ns = PROFILER.start(label)
+    try:
+        yield
+    finally:
+        if exec_info is not None and totals is not None:
+            for key, (call_time, num_calls) in _get_exec_info_totals(exec_info).items():
+                old_call_time, old_num_calls = totals.get(key, (0.0, 0))
+                if call_time > old_call_time:
+                    delta_num_calls = (
+                        num_calls - (old_num_calls or 0) if num_calls is not None else 1
+                    )
+                    PROFILER.add(key, int((call_time - old_call_time) * 1e9), delta_num_calls)
+        PROFILER.stop(start_ns)
+
+
+def profiled(label: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Decorator profiling each call to the decorated function as a node ``label``."""
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            if not PROFILER.enabled:
+                return func(*args, **kwargs)
+            start_ns = PROFILER.start(label)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                PROFILER.stop(start_ns)
+
+        return wrapper
+
+    return decorator
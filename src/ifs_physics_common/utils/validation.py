@@ -28,6 +28,8 @@ if TYPE_CHECKING:
     from sympl._core.data_array import DataArray
     from sympl._core.typingx import DataArrayDict
 
+    from ifs_physics_common.framework.communication import Communicator
+
 
 DEFAULT_ATOL: float = 1e-18
 DEFAULT_RTOL: float = 1e-12
@@ -40,15 +42,18 @@ def get_storages_for_validation(field_a: DataArray, field_b: DataArray) -> Tuple
     return a_np[slc], b_np[slc]
 
 
-def validate_field(
-    name,
+def get_field_errors(
     src_field: NDArray,
     trg_field: NDArray,
     atol: Optional[float] = None,
     rtol: Optional[float] = None,
-) -> None:
+) -> Tuple[float, float, bool]:
+    """Compute the maximum absolute and relative difference, and whether the fields are close."""
     assert src_field.shape == trg_field.shape
 
+    if src_field.size == 0:
+        return 0.0, 0.0, True
+
     if src_field.dtype.kind == "b":
         src_field = src_field.astype(float)
     if trg_field.dtype.kind == "b":
@@ -70,6 +75,20 @@ def validate_field(
     atol = atol or DEFAULT_ATOL
     rtol = rtol or DEFAULT_RTOL
     allclose = np.allclose(src_field, trg_field, atol=atol, rtol=rtol, equal_nan=True)
+
+    return float(abs_diff_max), float(rel_diff_max), bool(allclose)
+
+
+def print_field_errors(
+    name: str,
+    abs_diff_max: float,
+    rel_diff_max: float,
+    allclose: bool,
+    atol: Optional[float] = None,
+    rtol: Optional[float] = None,
+) -> None:
+    atol = atol or DEFAULT_ATOL
+    rtol = rtol or DEFAULT_RTOL
     print(
         f"   - {name:20s}:"
         f"\033[9{2 if abs_diff_max < atol else 1}m max abs diff = {abs_diff_max:.5E}\033[00m,"
@@ -78,13 +97,40 @@ def validate_field(
     )
 
 
+def _reduce_field_errors(
+    a: Tuple[float, float, bool], b: Tuple[float, float, bool]
+) -> Tuple[float, float, bool]:
+    return max(a[0], b[0]), max(a[1], b[1]), a[2] and b[2]
+
+
+def validate_field(
+    name,
+    src_field: NDArray,
+    trg_field: NDArray,
+    atol: Optional[float] = None,
+    rtol: Optional[float] = None,
+    comm: Optional[Communicator] = None,
+) -> None:
+    """
+    Compare ``src_field`` against ``trg_field``. If ``comm`` is given, the fields are the local
+    portions of global fields, and the errors are reduced over all ranks and printed by rank 0.
+    """
+    errors = get_field_errors(src_field, trg_field, atol=atol, rtol=rtol)
+    if comm is not None:
+        errors = comm.allreduce(errors, _reduce_field_errors)
+        if comm.rank != 0:
+            return
+    print_field_errors(name, *errors, atol=atol, rtol=rtol)
+
+
 def validate(
     src: DataArrayDict,
     trg: DataArrayDict,
     atol: Optional[float] = None,
     rtol: Optional[float] = None,
+    comm: Optional[Communicator] = None,
 ) -> None:
     common_keys = sorted(set(src.keys()).intersection(set(trg.keys())))
     for key in common_keys:
         src_field, trg_field = get_storages_for_validation(src[key], trg[key])
-        validate_field(key, src_field, trg_field, atol=atol, rtol=rtol)
+        validate_field(key, src_field, trg_field, atol=atol, rtol=rtol, comm=comm)